@@ -31,16 +31,30 @@ from modeltranslation.widgets import ClearableWidgetWrapper
 # ##################################################################
 
 import json
-import datetime
 from django.conf.urls import patterns, url
 from django.template.response import TemplateResponse
 from django.core.urlresolvers import reverse
 from django.contrib.admin import SimpleListFilter
-from django.http import HttpResponse
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.utils.translation import ugettext as _
+from django.db import transaction
 from django.db.models import F, Q
-from modeltranslation.templatetags.modeltranslation_tags import is_uptodate
+from modeltranslation.stats import (CONDITIONAL_EXPRESSIONS, annotate_translation_status,
+                                    cached_panel_stats, estimated_count,
+                                    estimated_translation_stats, export_rows, last_modified_name,
+                                    model_label, panel_stats, tracked_coverage, translation_stats,
+                                    translation_status_rows, updated_filters, updated_status_q)
+from modeltranslation.fields import update_filled_languages
+from modeltranslation.manager import MultilingualQuerySet
+from modeltranslation.templatetags.modeltranslation_tags import translation_field_status
+if CONDITIONAL_EXPRESSIONS:
+    from django.db.models import Case, Value, When
 from modeltranslation.translator import translator
 
 try:
@@ -48,6 +62,12 @@ try:
 except:
     from django.db.models.loading import get_model 
 
+try:
+    atomic = transaction.atomic
+except AttributeError:
+    # Django < 1.6
+    atomic = transaction.commit_on_success
+
 
 class JSONResponse(HttpResponse):
     """
@@ -59,6 +79,14 @@ class JSONResponse(HttpResponse):
         super(JSONResponse, self).__init__(content, **kwargs)
 
 
+def bad_request_response(message):
+    return JSONResponse({'error': message}, status=400)
+
+
+def unknown_field_response(field_name):
+    return bad_request_response('Unknown translation field: {0}'.format(field_name))
+
+
 class LanguageFilter(SimpleListFilter):
     title = 'language'
     parameter_name = 'lang'
@@ -70,6 +98,25 @@ class LanguageFilter(SimpleListFilter):
         return queryset
 
 
+# Primary key after which the keyset paginated translations view starts
+KEYSET_VAR = 'after'
+
+
+class KeysetFilter(SimpleListFilter):
+    """
+    Takes the keyset pagination parameter out of filters, pages are sought by
+    ``TranslationsChangeList``.
+    """
+    title = 'page'
+    parameter_name = KEYSET_VAR
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def queryset(self, request, queryset):
+        return queryset
+
+
 class TranslationStatusFilter(SimpleListFilter):
     title = 'translation'
     parameter_name = 'translation'
@@ -82,14 +129,27 @@ class TranslationStatusFilter(SimpleListFilter):
             )
 
     def queryset(self, request, queryset):
-        if self.value():
-            current_lang = request.GET.get('lang')
-            value = self.value()
+        current_lang = request.GET.get('lang')
+        if current_lang not in mt_settings.AVAILABLE_LANGUAGES:
+            return queryset
+        value = self.value()
+        if not CONDITIONAL_EXPRESSIONS:
+            # Django < 1.8
             if value == 'updated':
                 return queryset_updated(queryset, self.fields, current_lang)
-
             elif value == 'not-updated':
                 return queryset_not_updated(queryset, self.fields, current_lang)
+            return queryset
+
+        # Status of every field is computed in the database for the whole page, the changelist
+        # renders it instead of calling the is_uptodate tag per cell
+        queryset = annotate_translation_status(queryset, self.fields, current_lang)
+        if value:
+            if value == 'updated':
+                return queryset.filter(updated_status_q(self.fields, current_lang))
+
+            elif value == 'not-updated':
+                return queryset.exclude(updated_status_q(self.fields, current_lang))
 
             # elif value == 'to-translate':
             #     # to-translate includes all missing, equal & not-updated
@@ -133,32 +193,180 @@ class TranslationStatusFilter(SimpleListFilter):
 
             #     return queryset.filter(query)
             # return queryset
+        return queryset
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator estimating the number of objects (see ``estimated_count``).
+    """
+    _estimated_count = None
+
+    @property
+    def count(self):
+        if self._estimated_count is None:
+            self._estimated_count = estimated_count(self.object_list)
+        return self._estimated_count
+
+
+class TranslationsChangeList(ChangeList):
+    """
+    Changelist of the translations view. Depending on the ``translations_pagination`` and
+    ``translations_estimated_counts`` options of the model admin, it estimates its counts and
+    seeks pages by primary key (``?after=<pk>``) instead of using an OFFSET, which gets slow on
+    late pages of big tables. Keyset pages are ordered by primary key and can't be sorted.
+    """
+    next_key = None
+
+    @property
+    def keyset(self):
+        return self.model_admin.translations_pagination == 'keyset'
+
+    @property
+    def estimated_counts(self):
+        return self.model_admin.translations_estimated_counts
+
+    def count(self, queryset):
+        return estimated_count(queryset) if self.estimated_counts else queryset.count()
+
+    def get_ordering(self, request, queryset):
+        if self.keyset:
+            return ['pk']
+        return super(TranslationsChangeList, self).get_ordering(request, queryset)
+
+    def get_ordering_field_columns(self):
+        if self.keyset:
+            return {}
+        return super(TranslationsChangeList, self).get_ordering_field_columns()
+
+    def get_results(self, request):
+        if not self.keyset and not self.estimated_counts:
+            return super(TranslationsChangeList, self).get_results(request)
+
+        self.show_full_result_count = getattr(self.model_admin, 'show_full_result_count', True)
+        self.show_admin_actions = True
+        self.full_result_count = None
+        if self.show_full_result_count:
+            self.full_result_count = self.count(self.root_queryset)
+        if self.keyset:
+            return self.get_keyset_results(request)
+
+        paginator = EstimatedCountPaginator(self.queryset, self.list_per_page)
+        self.result_count = paginator.count
+        self.can_show_all = self.result_count <= self.list_max_show_all
+        self.multi_page = self.result_count > self.list_per_page
+        if (self.show_all and self.can_show_all) or not self.multi_page:
+            self.result_list = self.queryset._clone()
         else:
-            return queryset
+            try:
+                self.result_list = paginator.page(self.page_num + 1).object_list
+            except InvalidPage:
+                raise IncorrectLookupParameters
+        self.paginator = paginator
+
+    def get_keyset_results(self, request):
+        queryset = self.queryset.order_by('pk')
+        after = self.params.get(KEYSET_VAR)
+        if after:
+            try:
+                queryset = queryset.filter(pk__gt=self.opts.pk.to_python(after))
+            except ValidationError:
+                raise IncorrectLookupParameters
+        # One more key tells if there is a next page
+        keys = list(queryset.values_list('pk', flat=True)[:self.list_per_page + 1])
+        if len(keys) > self.list_per_page:
+            self.next_key = keys[self.list_per_page - 1]
+        self.result_list = queryset.filter(pk__in=keys[:self.list_per_page])
+        self.result_count = self.count(self.queryset)
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = None
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Changing filters starts from the first page
+        if self.keyset:
+            new_params = dict((k, v) for k, v in (new_params or {}).items() if k != ORDER_VAR)
+            remove = list(remove or []) + [ORDER_VAR]
+            if KEYSET_VAR not in new_params:
+                remove.append(KEYSET_VAR)
+        return super(TranslationsChangeList, self).get_query_string(new_params, remove)
+
+    def first_page_url(self):
+        return self.get_query_string(remove=[KEYSET_VAR])
+
+    def next_page_url(self):
+        if self.next_key is None:
+            return None
+        return self.get_query_string({KEYSET_VAR: self.next_key})
+
+
+# Changelist class -> its TranslationsChangeList subclass
+_CHANGELIST_CLASSES = {}
+
+
+def translations_changelist_factory(changelist_class):
+    """
+    Returns a subclass of ``changelist_class`` (e.g. one returned by ``get_changelist``) with the
+    pagination of ``TranslationsChangeList``.
+    """
+    if issubclass(changelist_class, TranslationsChangeList):
+        return changelist_class
+    if changelist_class is ChangeList:
+        return TranslationsChangeList
+    try:
+        return _CHANGELIST_CLASSES[changelist_class]
+    except KeyError:
+        class NewClass(TranslationsChangeList, changelist_class):
+            pass
+        NewClass.__name__ = 'Translations%s' % changelist_class.__name__
+        return _CHANGELIST_CLASSES.setdefault(changelist_class, NewClass)
 
 
 def queryset_updated(queryset, fields, lang):
-    filters = {}
-    for field in fields:
-        last_modified = '{0}_{1}_last_modified'.format(field, lang)
-        last_modified_default = '{0}_{1}_last_modified'.format(
-            field, mt_settings.DEFAULT_LANGUAGE)
-        # It is updated if the last_modified is gt the default one
-        filters['{0}__gt'.format(last_modified)] = F(last_modified_default) + datetime.timedelta(seconds=30)
-
-    return queryset.filter(**filters)
+    return queryset.filter(**updated_filters(fields, lang))
 
 
 def queryset_not_updated(queryset, fields, lang):
-    filters = {}
-    for field in fields:
-        last_modified = '{0}_{1}_last_modified'.format(field, lang)
-        last_modified_default = '{0}_{1}_last_modified'.format(
-            field, mt_settings.DEFAULT_LANGUAGE)
-        # It is updated if the last_modified is gt the default one
-        filters['{0}__gt'.format(last_modified)] = F(last_modified_default) + datetime.timedelta(seconds=30)
+    return queryset.exclude(**updated_filters(fields, lang))
+
 
-    return queryset.exclude(**filters)
+def update_translation_values(queryset, field_name, values, modified=None):
+    """
+    Sets ``field_name`` of instances of ``queryset`` to ``values`` (a pk -> value dict), stamping
+    its ``_last_modified`` field (if the field is monitored) with ``modified`` where the value
+    changes, as saving does. Values of all instances are set with a single UPDATE on
+    Django >= 1.8.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    modified_name = getattr(field, 'last_modified_name', None)
+    if modified is None:
+        modified = timezone.now()
+
+    def changed(pk, value):
+        return Q(pk=pk) & ~Q(**{field_name: value})
+
+    if CONDITIONAL_EXPRESSIONS:
+        updates = {}
+        if len(values) > 1:
+            updates[field_name] = Case(*[When(pk=pk, then=Value(value, output_field=field))
+                                         for pk, value in values.items()],
+                                       default=F(field_name), output_field=field)
+        else:
+            updates[field_name] = list(values.values())[0]
+        if modified_name:
+            updates[modified_name] = Case(
+                *[When(changed(pk, value), then=Value(modified)) for pk, value in values.items()],
+                default=F(modified_name),
+                output_field=queryset.model._meta.get_field(modified_name))
+        updated = queryset.filter(pk__in=list(values)).update(**updates)
+    else:
+        updated = 0
+        for pk, value in values.items():
+            if modified_name:
+                queryset.filter(changed(pk, value)).update(**{modified_name: modified})
+            updated += queryset.filter(pk=pk).update(**{field_name: value})
+    update_filled_languages(queryset.filter(pk__in=list(values)), [field.language])
+    return updated
 
 
 def modeltranslation_panel_view(request, models=None, exclude=None, **kwargs):
@@ -200,39 +408,37 @@ def modeltranslation_panel_view(request, models=None, exclude=None, **kwargs):
             if model in include_models:
                 include_models.remove(model)
 
+    # Statistics precomputed by the precompute_translation_stats command, if any
+    cached_stats = cached_panel_stats() or {'computed': None, 'models': {}}
+    context['stats_computed'] = cached_stats['computed']
+
+    include_models = [model for model in include_models
+                      if len(translator.get_options_for_model(model).get_translation_fields()) > 0]
+    # Models missing from the cache are counted now (concurrently if
+    # MODELTRANSLATION_PANEL_STATS_THREADS is set)
+    live_stats = panel_stats([model for model in include_models
+                              if model_label(model) not in cached_stats['models']])
+
     models_info = []
     for model in include_models:
-        model_options = translator.get_options_for_model(model)
-        translation_fields = model_options.get_translation_fields()
-        if len(translation_fields) > 0:
-            qs = model._default_manager.all()
-            instances = model_options.get_translation_queryset(qs)
-
-            languages = {}
-
-            for lang in mt_settings.AVAILABLE_LANGUAGES:
-                translated_instances = queryset_updated(
-                    instances, translation_fields, lang)
-                not_translated_instances = queryset_not_updated(
-                    instances, translation_fields, lang)
-
-                app_label = model._meta.app_label
-                try:
-                    model_info = (app_label, model._meta.model_name,)
-                except AttributeError:
-                    model_info = (app_label, model._meta.module_name,)
-
-                languages[lang] = {
-                    'translated': translated_instances.count(),
-                    'to_translate': not_translated_instances.count(),
-                    'total': instances.count(),
-                    'url': reverse('admin:%s_%s_translations' % model_info) + '?lang=' + lang + '&translation=not-updated',
-                }
-
-            models_info.append({
-                'name': model.__name__,
-                'languages': languages,
-            })
+        if model in live_stats:
+            languages = live_stats[model]
+        else:
+            languages = cached_stats['models'][model_label(model)]
+        app_label = model._meta.app_label
+        try:
+            model_info = (app_label, model._meta.model_name,)
+        except AttributeError:
+            model_info = (app_label, model._meta.module_name,)
+        url = reverse('admin:%s_%s_translations' % model_info)
+
+        for lang in mt_settings.AVAILABLE_LANGUAGES:
+            languages[lang]['url'] = url + '?lang=' + lang + '&translation=not-updated'
+
+        models_info.append({
+            'name': model.__name__,
+            'languages': languages,
+        })
 
     context['models'] = models_info
 
@@ -244,6 +450,10 @@ def modeltranslation_panel_view(request, models=None, exclude=None, **kwargs):
 class ModelTranslationPanelMixin(object):
 
     model_translations_template_name = 'admin/modeltranslation/model_translations.html'
+    # 'offset' (numbered pages) or 'keyset' (next pages sought by primary key, not sortable)
+    translations_pagination = 'offset'
+    # Estimate counts of the translations view from database statistics (PostgreSQL only)
+    translations_estimated_counts = False
 
     def get_model_info(self):
         # module_name is renamed to model_name in Django 1.8
@@ -255,6 +465,9 @@ class ModelTranslationPanelMixin(object):
 
     def get_queryset(self, request):
         super_qs = super(ModelTranslationPanelMixin, self).get_queryset(request)
+        if isinstance(super_qs, MultilingualQuerySet):
+            # Admin forms and the translations view read every language.
+            super_qs = super_qs.lean(False)
         view_name = request.resolver_match.view_name
         # For the translations_view, we filter using the given parameters
         if view_name.endswith('_translations'):
@@ -273,81 +486,189 @@ class ModelTranslationPanelMixin(object):
             url(r'^process_translations/$',
                 self.admin_site.admin_view(self.process_translations),
                 name='%s_%s_process_translations' % info),
+            url(r'^process_translations_batch/$',
+                self.admin_site.admin_view(self.process_translations_batch),
+                name='%s_%s_process_translations_batch' % info),
             url(r'^translations/$',
                 self.admin_site.admin_view(self.translations),
                 name='%s_%s_translations' % info),
+            url(r'^export_translations/$',
+                self.admin_site.admin_view(self.export_translations),
+                name='%s_%s_export_translations' % info),
         )
         return my_urls + urls
 
     def update_translations(self, request, *args, **kwargs):
-        # We have to save the updated field
+        # We have to save the updated status, only the last_modified field is updated
         data = json.loads(request.body)
         current_lang = data['lang']
         field_name = data['name']
+        if field_name not in self.get_translation_field_names():
+            return unknown_field_response(field_name)
         new_status = data['status']
+        pk = self.model._meta.pk.to_python(data['instance'])
+        queryset = self.model._default_manager.filter(pk=pk)
 
-        instance = self.model.objects.get(pk=data['instance'])
-
-        last_modified = 'Unknown'
-        if hasattr(instance, '{0}_last_modified'.format(field_name)):
+        field = self.model._meta.get_field(field_name)
+        if field.last_modified_name:
             if new_status == 'updated':
-                now = timezone.now()
-                last_modified = now.strftime('%d-%m-%Y %H:%M:%S')
-                setattr(instance, '{0}_last_modified'.format(field_name), now)
-                instance.save()
-                new_value = getattr(instance, field_name)
-
+                last_modified = timezone.now()
             elif new_status == 'not-updated':
-                last_modified_default = getattr(instance, '{0}_{1}_last_modified'.format(
-                    field_name[:-3], mt_settings.DEFAULT_LANGUAGE))
-                last_modified = last_modified_default.strftime('%d-%m-%Y %H:%M:%S')
-                setattr(instance, '{0}_last_modified'.format(field_name), last_modified_default)
-                instance.save()
-                new_value = getattr(instance, field_name)
+                last_modified = F(last_modified_name(
+                    field.translated_field.name, mt_settings.DEFAULT_LANGUAGE))
+            else:
+                last_modified = None
+            if last_modified is not None:
+                with tracked_coverage(self.model, [pk]):
+                    queryset.update(**{field.last_modified_name: last_modified})
 
         # Get the new status
-        new_status = is_uptodate(
-            instance, field_name[:-3], current_lang, mt_settings.DEFAULT_LANGUAGE)
-
-        return JSONResponse({
-            'status': new_status,
-            'instance_id': instance.pk,
-            'field_name': field_name,
-            'last_modified': last_modified,
-            'field_value': new_value,
-            })
+        statuses = self.get_translation_statuses([(pk, field_name)], current_lang)
+        if not statuses:
+            raise Http404
+        return JSONResponse(statuses[0])
 
     # This is the actual view function that will be executed when accessing the panel
     def process_translations(self, request, *args, **kwargs):
-        # We have to save the updated field
+        # We have to save the updated field, with a single UPDATE (see update_translation_values)
         data = json.loads(request.body)
-
         current_lang = data['lang']
-
         field_name = data['name']
-        field_value = data['value']
+        if field_name not in self.get_translation_field_names():
+            return unknown_field_response(field_name)
+        pk = self.model._meta.pk.to_python(data['instance'])
 
-        instance = self.model.objects.get(pk=data['instance'])
+        with tracked_coverage(self.model, [pk]):
+            update_translation_values(
+                self.model._default_manager.all(), field_name, {pk: data['value']})
 
-        setattr(instance, field_name, field_value)
-        instance.save()
-        new_value = getattr(instance, field_name)
+        # Get the new status
+        statuses = self.get_translation_statuses([(pk, field_name)], current_lang)
+        if not statuses:
+            raise Http404
+        return JSONResponse(statuses[0])
 
-        last_modified = 'Unknown'
-        if hasattr(instance, '{0}_last_modified'.format(field_name)):
-            last_modified = getattr(instance, '{0}_last_modified'.format(field_name))
-            last_modified = last_modified.strftime('%d-%m-%Y %H:%M:%S')
+    def get_translation_field_names(self):
+        """
+        Names of localized fields editable in the translations panel.
+        """
+        return set(build_localized_fieldname(field, lang)
+                   for field in self.trans_opts.get_translation_fields()
+                   for lang in mt_settings.AVAILABLE_LANGUAGES)
 
-        # Get the new status
-        new_status = is_uptodate(instance, field_name[:-3], current_lang, mt_settings.DEFAULT_LANGUAGE)
-
-        return JSONResponse({
-            'status': new_status,
-            'instance_id': instance.pk,
-            'field_name': field_name,
-            'last_modified': last_modified,
-            'field_value': new_value,
+    def get_translation_statuses(self, edited, lang):
+        """
+        Reads the values and statuses of edited ``(pk, field_name)`` pairs from the database, with
+        a single query.
+        """
+        fields = {}
+        for pk, field_name in edited:
+            fields[field_name] = self.model._meta.get_field(field_name).translated_field.name
+        # Only columns needed by the statuses are loaded
+        columns = set(['pk'])
+        for field_name, field in fields.items():
+            default_field_name = build_localized_fieldname(field, mt_settings.DEFAULT_LANGUAGE)
+            columns.update((field_name, build_localized_fieldname(field, lang),
+                            default_field_name))
+            if self.model._meta.get_field(field_name).last_modified_name:
+                columns.update((last_modified_name(field, lang),
+                                last_modified_name(field, mt_settings.DEFAULT_LANGUAGE)))
+        queryset = self.model._default_manager.lean(False).filter(
+            pk__in=set(pk for pk, _ in edited))
+        queryset = annotate_translation_status(queryset.only(*columns), set(fields.values()), lang)
+        instances = dict((instance.pk, instance) for instance in queryset)
+        statuses = []
+        for pk, field_name in edited:
+            instance = instances.get(pk)
+            if instance is None:
+                continue
+            last_modified = getattr(instance, '{0}_last_modified'.format(field_name), None)
+            statuses.append({
+                'status': translation_field_status(
+                    instance, fields[field_name], lang, mt_settings.DEFAULT_LANGUAGE),
+                'instance_id': instance.pk,
+                'field_name': field_name,
+                'last_modified': (last_modified.strftime('%d-%m-%Y %H:%M:%S')
+                                  if last_modified else 'Unknown'),
+                'field_value': getattr(instance, field_name),
             })
+        return statuses
+
+    def process_translations_batch(self, request, *args, **kwargs):
+        """
+        Saves many translations at once. Expects a JSON payload like::
+
+            {"lang": "de", "edits": [{"instance": 1, "name": "title_de", "value": "Titel"}, ...]}
+
+        Edits are applied in one transaction, with one UPDATE per edited field, and the new
+        statuses of all edited fields are returned (see ``process_translations``). Malformed
+        payloads get a 400 response and nothing is saved.
+        """
+        if not self.has_change_permission(request, None):
+            raise PermissionDenied
+        try:
+            data = json.loads(request.body.decode('utf-8'))
+            current_lang = data['lang']
+            edits = list(data['edits'])
+        except (ValueError, KeyError, TypeError):
+            return bad_request_response('Expected a JSON object with "lang" and "edits".')
+        if current_lang not in mt_settings.AVAILABLE_LANGUAGES:
+            return bad_request_response('Unknown language: {0}'.format(current_lang))
+        allowed_names = self.get_translation_field_names()
+
+        values = {}
+        edited = []
+        for edit in edits:
+            try:
+                field_name, value = edit['name'], edit['value']
+                if field_name not in allowed_names:
+                    return unknown_field_response(field_name)
+                # Pks are compared with the refetched ones
+                pk = self.model._meta.pk.to_python(edit['instance'])
+            except (KeyError, TypeError, ValidationError):
+                return bad_request_response('Invalid edit: {0}'.format(json.dumps(edit)))
+            field_values = values.setdefault(field_name, {})
+            if pk not in field_values:
+                edited.append((pk, field_name))
+            field_values[pk] = value
+
+        now = timezone.now()
+        queryset = self.model._default_manager.all()
+        with atomic():
+            with tracked_coverage(self.model, set(pk for pk, _ in edited)):
+                for field_name, field_values in values.items():
+                    update_translation_values(queryset, field_name, field_values, now)
+
+        return JSONResponse({'results': self.get_translation_statuses(edited, current_lang)})
+
+    def export_translations(self, request, *args, **kwargs):
+        """
+        Streams the translation status of every instance, translation field and language (or
+        only ``?lang=``) as CSV, or JSON lines with ``?format=jsonl``.
+        """
+        if not self.has_change_permission(request, None):
+            raise PermissionDenied
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in ('csv', 'jsonl'):
+            raise Http404('Unknown export format: {0}'.format(export_format))
+        languages = None
+        if 'lang' in request.GET:
+            if request.GET['lang'] not in mt_settings.AVAILABLE_LANGUAGES:
+                raise Http404('Unknown language: {0}'.format(request.GET['lang']))
+            languages = [request.GET['lang']]
+
+        queryset = self.trans_opts.get_translation_queryset(self.model._default_manager.all())
+        rows = translation_status_rows(
+            queryset, self.trans_opts.get_translation_fields(), languages)
+        content_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        response = StreamingHttpResponse(export_rows(rows, export_format),
+                                         content_type=content_type)
+        response['Content-Disposition'] = 'attachment; filename="%s-translations.%s"' % (
+            model_label(self.model), export_format)
+        return response
+
+    def get_translations_changelist(self, request):
+        return translations_changelist_factory(self.get_changelist(request))
 
     def translations(self, request, extra_context=None):
         context = {}
@@ -372,19 +693,15 @@ class ModelTranslationPanelMixin(object):
 
             request.GET = query_parameters
 
-            filters = {}
-
             # Now lets count the number of results for each kind
-            for field in self.trans_opts.monitored_fields:
-                last_modified = '{0}_{1}_last_modified'.format(field, current_lang)
-                last_modified_default = '{0}_{1}_last_modified'.format(
-                    field, mt_settings.DEFAULT_LANGUAGE)
-                # It is updated if the last_modified is gt the default one
-                filters['{0}__gt'.format(last_modified)] = F(last_modified_default) + datetime.timedelta(seconds=30)
-
-            all_queryset = self.get_queryset(request)
-            context["translated_count"] = all_queryset.filter(**filters).count()
-            context["not_translated_count"] = all_queryset.exclude(**filters).count()
+            if self.translations_estimated_counts:
+                get_stats = estimated_translation_stats
+            else:
+                get_stats = translation_stats
+            stats = get_stats(
+                self.get_queryset(request), self.trans_opts.monitored_fields, [current_lang])
+            context["translated_count"] = stats[current_lang]['translated']
+            context["not_translated_count"] = stats[current_lang]['to_translate']
 
             # Set the list of editable fields
             translation_fields = self.trans_opts.get_translation_fields()
@@ -410,7 +727,7 @@ class ModelTranslationPanelMixin(object):
 
         # Include the language filter as a list_filter
         TranslationStatusFilter.fields = self.trans_opts.get_translation_fields()
-        list_filter = self.list_filter + (LanguageFilter, TranslationStatusFilter)
+        list_filter = self.list_filter + (LanguageFilter, TranslationStatusFilter, KeysetFilter)
 
         # Check actions to see if any are available on this changelist
         actions = self.get_actions(request)
@@ -418,7 +735,7 @@ class ModelTranslationPanelMixin(object):
             # Add the action checkboxes if there are any actions available.
             list_display = ['action_checkbox'] + list(list_display)
 
-        ChangeList = self.get_changelist(request)
+        ChangeList = self.get_translations_changelist(request)
         try:
             cl = ChangeList(request, self.model, list_display,
                 list_display_links, list_filter, self.date_hierarchy,
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Optional app storing translation statistics, used when ``MODELTRANSLATION_COVERAGE_STORE`` is
+enabled. Add ``modeltranslation.coverage`` to ``INSTALLED_APPS`` to use it.
+"""
+default_app_config = 'modeltranslation.coverage.apps.CoverageConfig'
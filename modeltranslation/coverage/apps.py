@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from django.apps import AppConfig
+
+
+class CoverageConfig(AppConfig):
+    name = 'modeltranslation.coverage'
+    label = 'modeltranslation_coverage'
+    verbose_name = 'Modeltranslation coverage'
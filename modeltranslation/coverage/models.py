@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+
+
+class TranslationCoverage(models.Model):
+    """
+    Translation statistics of a registered model in a language, maintained incrementally when
+    ``MODELTRANSLATION_COVERAGE_STORE`` is enabled (see ``modeltranslation.stats``).
+    """
+    model = models.CharField(max_length=255)  # app_label.model_name
+    language = models.CharField(max_length=15)
+    translated = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = 'modeltranslation_coverage'
+        unique_together = ('model', 'language')
+
+    def __str__(self):
+        return '%s [%s]: %d/%d' % (self.model, self.language, self.translated, self.total)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from django import VERSION
 from django import forms
-from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.core.exceptions import ImproperlyConfigured
 from django.db.models import fields
 from django.utils import six, timezone
+from django.utils.functional import cached_property
 from django.db import models
 
 from modeltranslation import settings as mt_settings
@@ -112,6 +113,8 @@ class TranslationField(object):
         self.empty_value = empty_value
         if empty_value is NONE:
             self.empty_value = None if translated_field.null else ''
+        # Name of the ``_last_modified`` companion field, if changes of this field are monitored
+        self.last_modified_name = None
 
         # Default behaviour is that all translations are optional
         if not isinstance(self, fields.BooleanField):
@@ -293,37 +296,164 @@ class TranslationField(object):
 
     def pre_save(self, model_instance, add):
         # Here we just saved the translated field, so we have to update the last_modified (if present)
-        if not add and hasattr(model_instance, '{0}_last_modified'.format(self.name)):
-            # Check if this field has changed
-            try:
-                db_model_instance = model_instance._default_manager.get(pk=model_instance.pk)
-            except ObjectDoesNotExist:
-                db_model_instance = None
-
-            if db_model_instance is not None:
-                # If the info has changed, we need to update the last_modified field
-                is_dirty = getattr(db_model_instance, self.name) != getattr(model_instance, self.name)
-                if is_dirty:
-                    now = timezone.now()
-                    setattr(model_instance, '{0}_last_modified'.format(self.name), now)
-
+        if self.last_modified_name is not None:
+            self.update_last_modified(model_instance, add)
         return super(TranslationField, self).pre_save(model_instance, add)
 
+    def update_last_modified(self, model_instance, add):
+        """
+        Stamps the ``_last_modified`` companion if the value differs from the one last loaded from
+        (or saved to) the database.
+
+        Loaded values are remembered when instances are created from database rows (see
+        ``patch_from_db``) and once they are saved (see ``remember_saved_values``); the ones that
+        are not known (e.g. deferred fields or instances constructed with a primary key) are
+        fetched with a single query for all monitored fields.
+        """
+        if add:
+            return
+        value = getattr(model_instance, self.attname)
+        snapshot = model_instance.__dict__.setdefault('_mt_snapshot', {})
+        if self.attname not in snapshot:
+            load_snapshot(model_instance, snapshot)
+        # If the info has changed, we need to update the last_modified field
+        if self.attname in snapshot and snapshot[self.attname] != value:
+            setattr(model_instance, self.last_modified_name, timezone.now())
+
+
+def load_snapshot(model_instance, snapshot):
+    """
+    Fetches database values of all monitored translation fields missing from ``snapshot``.
+    """
+    missing = [f.attname for f in model_instance._meta.concrete_fields
+               if getattr(f, 'last_modified_name', None) and f.attname not in snapshot]
+    manager = model_instance.__class__._base_manager.db_manager(model_instance._state.db)
+    for row in manager.lean(False).filter(pk=model_instance.pk).values(*missing)[:1]:
+        snapshot.update(row)
+
+
+def remember_saved_values(sender, instance, update_fields=None, **kwargs):
+    """
+    Remembers saved values of monitored translation fields and their ``_last_modified`` fields
+    (``post_save`` receiver), so that a save that fails doesn't leave unsaved values behind.
+    """
+    loaded = instance.__dict__
+    snapshot = loaded.setdefault('_mt_snapshot', {})
+    for field in instance._meta.concrete_fields:
+        if not getattr(field, 'last_modified_name', None):
+            continue
+        for name, attname in ((field.name, field.attname),
+                              (field.last_modified_name, field.last_modified_name)):
+            if update_fields is not None and not (name in update_fields or
+                                                  attname in update_fields):
+                continue
+            if attname in loaded:
+                snapshot[attname] = loaded[attname]
+
+
+def filled_field_name(lang):
+    """
+    Name of the field telling if translation fields of an instance are all filled in ``lang``
+    (added by the ``track_filled`` translation option).
+    """
+    return build_localized_fieldname('translations_filled', lang)
+
+
+def filled_q(model, field_names, lang):
+    """
+    Q object matching instances of ``model`` whose ``field_names`` are all filled (neither null
+    nor empty strings) in ``lang``.
+    """
+    q = models.Q()
+    for field_name in field_names:
+        name = build_localized_fieldname(field_name, lang)
+        q &= ~models.Q(**{'{0}__isnull'.format(name): True})
+        if model._meta.get_field(name).empty_strings_allowed:
+            q &= ~models.Q(**{name: ''})
+    return q
+
+
+def update_filled_languages(queryset, languages=None):
+    """
+    Recomputes ``track_filled`` columns of instances of ``queryset`` in ``languages`` (all
+    available languages by default) with two UPDATE statements per language. Needed after
+    queryset updates of translation fields, which don't go through ``pre_save``.
+    """
+    model = queryset.model
+    names = set(f.name for f in model._meta.concrete_fields)
+    if languages is None:
+        languages = mt_settings.AVAILABLE_LANGUAGES
+    for lang in languages:
+        name = filled_field_name(lang)
+        if name not in names:
+            continue
+        q = filled_q(model, model._meta.get_field(name).translated_fields, lang)
+        queryset.filter(q).update(**{name: True})
+        queryset.exclude(q).update(**{name: False})
+
+
+class FilledLanguageField(fields.BooleanField):
+    """
+    Tells if ``translated_fields`` of an instance are all filled in ``language``, updated on
+    save. Its index lets querysets find missing translations without checking every column (see
+    ``MultilingualQuerySet.filled``).
+    """
+    def __init__(self, translated_fields=(), language=None, *args, **kwargs):
+        self.translated_fields = tuple(translated_fields)
+        self.language = language
+        kwargs.setdefault('default', False)
+        kwargs.setdefault('editable', False)
+        kwargs.setdefault('db_index', True)
+        super(FilledLanguageField, self).__init__(*args, **kwargs)
+
+    def pre_save(self, model_instance, add):
+        opts = model_instance._meta
+        value = True
+        for field_name in self.translated_fields:
+            field = opts.get_field(build_localized_fieldname(field_name, self.language))
+            field_value = getattr(model_instance, field.attname)
+            if field_value is None or (field.empty_strings_allowed and not field_value):
+                value = False
+                break
+        setattr(model_instance, self.attname, value)
+        return value
+
+    def deconstruct(self):
+        # Migrations only need the column
+        name, path, args, kwargs = super(FilledLanguageField, self).deconstruct()
+        return name, 'django.db.models.BooleanField', args, kwargs
+
 
 class TranslationFieldDescriptor(object):
     """
     A descriptor used for the original translated field.
     """
     def __init__(self, field, fallback_languages=None, fallback_value=NONE,
-                 fallback_undefined=NONE):
+                 fallback_undefined=NONE, meta=None):
         """
         Stores fallback options and the original field, so we know it's name
         and default.
+
+        ``meta`` is the ``TranslationMeta`` of the model the field belongs to, read from the
+        translator if not given (the model has to be registered already).
         """
+        if meta is None:
+            from modeltranslation.translator import translator
+            meta = translator.get_options_for_model(field.model).meta
         self.field = field
         self.fallback_languages = fallback_languages
         self.fallback_value = fallback_value
         self.fallback_undefined = fallback_undefined
+        self.meta = meta
+        self._is_file = isinstance(field, fields.files.FileField)
+        # Value that marks a translation as undefined, ``NONE`` if it has to be computed on
+        # every access (the field has a callable default).
+        self._undefined = fallback_undefined
+        if fallback_undefined is NONE:
+            self._undefined = meta.defaults.get(field.name, NONE)
+        # (language, fallbacks enabled) -> ((localized name, read from __dict__?), ...)
+        self._chains = {}
+        self._chains_for = None
 
     def __set__(self, instance, value):
         """
@@ -345,6 +475,29 @@ class TranslationFieldDescriptor(object):
                 isinstance(undefined, fields.files.FieldFile) and val == undefined)
         return val is not None and val != undefined
 
+    def fallback_chain(self, lang):
+        """
+        Returns localized names to probe, in order, when ``lang`` is active - each paired with
+        a flag telling if the value can be read straight from the instance ``__dict__`` (that is,
+        the model class doesn't define a descriptor for it).
+
+        Chains are cached per language and fallbacks toggle, and rebuilt when fallback settings
+        are reloaded.
+        """
+        if self._chains_for is not mt_settings.FALLBACK_LANGUAGES:
+            self._chains = {}
+            self._chains_for = mt_settings.FALLBACK_LANGUAGES
+        key = (lang, mt_settings.ENABLE_FALLBACKS)
+        try:
+            return self._chains[key]
+        except KeyError:
+            mro = self.meta.model.__mro__
+            chain = tuple(
+                (name, not any(name in klass.__dict__ for klass in mro))
+                for name in self.meta.fallback_names(self.field.name, lang))
+            self._chains[key] = chain
+            return chain
+
     def __get__(self, instance, owner):
         """
         Returns value from the translation field for the current language, or
@@ -354,56 +507,82 @@ class TranslationFieldDescriptor(object):
         if instance is None:
             return self
         default = NONE
-        undefined = self.fallback_undefined
+        undefined = self._undefined
         if undefined is NONE:
             default = self.field.get_default()
             undefined = default
-        langs = resolution_order(get_language(), self.fallback_languages)
-        for lang in langs:
-            loc_field_name = build_localized_fieldname(self.field.name, lang)
-            val = getattr(instance, loc_field_name, None)
-            if self.meaningful_value(val, undefined):
+        values = instance.__dict__
+        for loc_field_name, direct in self.fallback_chain(get_language()):
+            # Deferred (not yet loaded) values are missing from __dict__, getattr loads them.
+            val = values.get(loc_field_name, NONE) if direct else NONE
+            if val is NONE:
+                val = getattr(instance, loc_field_name, None)
+            if self._is_file:
+                if self.meaningful_value(val, undefined):
+                    return val
+            elif val is not None and val != undefined:
                 return val
+        return self.missing_value(instance, default)
+
+    def missing_value(self, instance, default=NONE):
+        """
+        Returns the value used when no translation in the fallback chain is meaningful: the
+        custom fallback value or field's default value.
+        """
         if mt_settings.ENABLE_FALLBACKS and self.fallback_value is not NONE:
             return self.fallback_value
         else:
             if default is NONE:
-                default = self.field.get_default()
+                default = self.get_default()
             # Some fields like FileField behave strange, as their get_default() doesn't return
             # instance of attr_class, but rather None or ''.
             # Normally this case is handled in the descriptor, but since we have overridden it, we
             # must mock it up.
-            if (isinstance(self.field, fields.files.FileField) and
-                    not isinstance(default, self.field.attr_class)):
+            if self._is_file and not isinstance(default, self.field.attr_class):
                 return self.field.attr_class(instance, self.field, default)
             return default
 
+    def missing_value_is_static(self):
+        """
+        Tells if ``missing_value`` returns the same (immutable) value on every call.
+        """
+        if mt_settings.ENABLE_FALLBACKS and self.fallback_value is not NONE:
+            return True
+        return not self._is_file and self.meta.defaults.get(self.field.name, NONE) is not NONE
+
+    def get_default(self):
+        """
+        Returns the default of the original field, precompiled unless it is a callable.
+        """
+        default = self.meta.defaults.get(self.field.name, NONE)
+        if default is NONE:
+            return self.field.get_default()
+        return default
+
 
 class TranslatedRelationIdDescriptor(object):
     """
     A descriptor used for the original '_id' attribute of a translated
     ForeignKey field.
     """
-    def __init__(self, field_name, fallback_languages):
+    def __init__(self, field_name, fallback_languages, meta):
         self.field_name = field_name  # The name of the original field (excluding '_id')
         self.fallback_languages = fallback_languages
+        self.meta = meta  # TranslationMeta of the model
 
     def __set__(self, instance, value):
-        lang = get_language()
-        loc_field_name = build_localized_fieldname(self.field_name, lang)
         # Localized field name with '_id'
-        loc_attname = instance._meta.get_field(loc_field_name).get_attname()
+        loc_attname = self.meta.fk_attnames[self.field_name][get_language()]
         setattr(instance, loc_attname, value)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
+        attnames = self.meta.fk_attnames[self.field_name]
         langs = resolution_order(get_language(), self.fallback_languages)
         for lang in langs:
-            loc_field_name = build_localized_fieldname(self.field_name, lang)
             # Localized field name with '_id'
-            loc_attname = instance._meta.get_field(loc_field_name).get_attname()
-            val = getattr(instance, loc_attname, None)
+            val = getattr(instance, attnames[lang], None)
             if val is not None:
                 return val
         return None
@@ -420,3 +599,59 @@ class LanguageCacheSingleObjectDescriptor(object):
         lang = get_language()
         cache = build_localized_fieldname(self.accessor, lang)
         return "_%s_cache" % cache
+
+
+def fallback_prefetch_queryset(field, instances, queryset):
+    """
+    Returns what ``prefetch_related`` expects from a reverse ForeignKey manager for the translated
+    ForeignKey ``field``, following it through fallback languages: objects whose ``field`` resolves
+    to one of ``instances``, with the relation cached for the language it was resolved in.
+    """
+    from modeltranslation.translator import translator
+    meta = translator.get_options_for_model(field.model).meta
+    names = meta.fallback_names(field.name, get_language())
+    lookup = None
+    skipped = {}
+    for name in names:
+        # Only match through a language if all languages before it are empty.
+        q = models.Q(**dict(skipped, **{'%s__in' % name: instances}))
+        lookup = q if lookup is None else lookup | q
+        skipped['%s__isnull' % name] = True
+    queryset = queryset.filter(lookup)
+
+    instance_attr = field.get_foreign_related_value
+    instances_dict = dict((instance_attr(inst), inst) for inst in instances)
+    for rel_obj in queryset:
+        for name in names:
+            loc_field = rel_obj._meta.get_field(name)
+            value = loc_field.get_local_related_value(rel_obj)
+            if value in instances_dict:
+                setattr(rel_obj, loc_field.get_cache_name(), instances_dict[value])
+                break
+    return (queryset, field.get_local_related_value, instance_attr, False,
+            field.related_query_name())
+
+
+class LanguageFallbackRelatedObjectsDescriptor(object):
+    """
+    A Mixin for ForeignRelatedObjectsDescriptors (reverse side of a translated ForeignKey) which
+    makes related managers prefetch through fallback languages, if the prefetch queryset asks for
+    it (see ``MultilingualQuerySet.related_fallbacks``).
+    """
+    @property
+    def translated_field(self):
+        return self.field if NEW_RELATED_API else self.related.field
+
+    @cached_property
+    def related_manager_cls(self):
+        superclass = super(LanguageFallbackRelatedObjectsDescriptor, self).related_manager_cls
+        field = self.translated_field
+
+        class FallbackRelatedManager(superclass):
+            def get_prefetch_queryset(self, instances, queryset=None):
+                if not getattr(queryset, '_related_fallbacks', False):
+                    return super(FallbackRelatedManager, self).get_prefetch_queryset(
+                        instances, queryset)
+                queryset = queryset.using(queryset._db or self._db)
+                return fallback_prefetch_queryset(field, instances, queryset)
+        return FallbackRelatedManager
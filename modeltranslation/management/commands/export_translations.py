@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from modeltranslation import settings as mt_settings
+from modeltranslation.stats import export_rows, model_label, translation_status_rows
+from modeltranslation.translator import translator
+
+
+class Command(BaseCommand):
+    args = '[app_label.model_name ...]'
+    help = ('Exports the translation status of every instance, translation field and language'
+            ' of registered models (all of them by default) as CSV or JSON lines.')
+
+    option_list = BaseCommand.option_list + (
+        make_option('--format', dest='format', default='csv',
+                    help='Output format: csv (default) or jsonl.'),
+        make_option('--language', dest='language', default=None,
+                    help='Only export this language (non default languages by default).'),
+        make_option('--chunk-size', dest='chunk_size', type='int', default=1000,
+                    help='Number of instances read from the database at once.'),
+    )
+
+    def handle(self, *args, **options):
+        if options['format'] not in ('csv', 'jsonl'):
+            raise CommandError("Unknown format: '%s'" % options['format'])
+        languages = None
+        if options['language'] is not None:
+            if options['language'] not in mt_settings.AVAILABLE_LANGUAGES:
+                raise CommandError("Unknown language: '%s'" % options['language'])
+            languages = [options['language']]
+
+        models = translator.get_registered_models(abstract=False)
+        if args:
+            labels = dict((model_label(model), model) for model in models)
+            try:
+                models = [labels[label.lower()] for label in args]
+            except KeyError as e:
+                raise CommandError("Unknown registered model: '%s'" % e.args[0])
+
+        for i, model in enumerate(models):
+            opts = translator.get_options_for_model(model)
+            queryset = opts.get_translation_queryset(model._default_manager.all())
+            rows = translation_status_rows(
+                queryset, opts.get_translation_fields(), languages, options['chunk_size'])
+            lines = export_rows(rows, options['format'])
+            if i > 0 and options['format'] == 'csv':
+                # A single header line
+                next(lines)
+            for line in lines:
+                self.stdout.write(line, ending='')
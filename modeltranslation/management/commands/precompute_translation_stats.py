@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand, CommandError
+
+from modeltranslation import settings as mt_settings
+from modeltranslation.stats import precompute_panel_stats
+
+
+class Command(BaseCommand):
+    help = ('Precomputes translation panel statistics into the cache set by'
+            ' MODELTRANSLATION_PANEL_STATS_CACHE (meant to be run on a schedule).')
+
+    def handle(self, *args, **options):
+        verbosity = int(options['verbosity'])
+        if not mt_settings.PANEL_STATS_CACHE:
+            raise CommandError('MODELTRANSLATION_PANEL_STATS_CACHE is not set.')
+        stats = precompute_panel_stats()
+        if verbosity > 0:
+            self.stdout.write('Computed translation statistics of %d models\n' %
+                              len(stats['models']))
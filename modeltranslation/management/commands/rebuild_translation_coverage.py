@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand, CommandError
+
+from modeltranslation import settings as mt_settings
+from modeltranslation.stats import model_label, rebuild_coverage
+from modeltranslation.translator import translator
+
+
+class Command(BaseCommand):
+    help = ('Recomputes translation statistics stored in the coverage table'
+            ' (used when MODELTRANSLATION_COVERAGE_STORE is enabled).')
+
+    def handle(self, *args, **options):
+        if not mt_settings.COVERAGE_INSTALLED:
+            raise CommandError('"modeltranslation.coverage" is not in INSTALLED_APPS.')
+        from modeltranslation.coverage.models import TranslationCoverage
+
+        verbosity = int(options['verbosity'])
+        models = translator.get_registered_models(abstract=False)
+        # Forget models that are not registered anymore
+        TranslationCoverage.objects.exclude(
+            model__in=[model_label(model) for model in models]).delete()
+        for model in models:
+            if verbosity > 0:
+                self.stdout.write("Rebuilding coverage of model '%s'\n" % model)
+            rebuild_coverage([model])
@@ -2,6 +2,7 @@
 from django.db.models import F, Q
 from django.core.management.base import BaseCommand
 
+from modeltranslation.fields import update_filled_languages
 from modeltranslation.settings import DEFAULT_LANGUAGE
 from modeltranslation.translator import translator
 from modeltranslation.utils import build_localized_fieldname
@@ -31,3 +32,4 @@ class Command(BaseCommand):
 
                 model._default_manager.filter(q).rewrite(False).update(
                     **{def_lang_fieldname: F(field_name)})
+            update_filled_languages(model._default_manager.all(), [DEFAULT_LANGUAGE])
@@ -21,9 +21,10 @@ try:
     from django.db.models.sql.where import Constraint
     NEW_RELATED_API = False
 except ImportError:
-    from django.db.models.query import ValuesIterable
+    from django.db.models.query import ModelIterable, ValuesIterable
     NEW_RELATED_API = True  # Django 1.9
 
+from django.utils import six
 from django.utils.six import moves
 from django.utils.tree import Node
 try:
@@ -32,11 +33,28 @@ try:
     NEW_LOOKUPS = True  # Django 1.7, 1.8
 except ImportError:
     NEW_LOOKUPS = False
+try:
+    from django.db.models import F, Func, Value
+    from django.db.models.functions import Coalesce
+    QUERY_EXPRESSIONS = True  # Django 1.8
+except ImportError:
+    QUERY_EXPRESSIONS = False
+try:
+    from django.db.models import Prefetch
+except ImportError:
+    Prefetch = None  # Django < 1.7
+from django.utils.encoding import force_text
+from django.utils.functional import Promise
 
 from modeltranslation import settings
-from modeltranslation.fields import TranslationField
-from modeltranslation.utils import (build_localized_fieldname, get_language,
-                                    auto_populate, resolution_order)
+from modeltranslation.fields import (NONE, TranslationField, filled_field_name, filled_q,
+                                     LanguageFallbackRelatedObjectsDescriptor)
+from modeltranslation.utils import build_localized_fieldname, get_language, auto_populate
+
+
+def get_translation_meta(model):
+    from modeltranslation.translator import translator
+    return translator.get_options_for_model(model).meta
 
 
 def get_translatable_fields_for_model(model):
@@ -47,7 +65,56 @@ def get_translatable_fields_for_model(model):
         return None
 
 
+# Rewritten lookup keys, keyed by (model, lookup_key, language). Rewriting only depends on the
+# translation registry and the language, so the cache is flushed whenever a model gets
+# (un)registered. Once it grows past _RLK_CACHE_SIZE it's simply emptied - the set of keys a
+# project uses is small, so this is enough to keep it bounded.
+_RLK_CACHE = {}
+_RLK_CACHE_SIZE = 4096
+
+# Rewritten ``Meta.ordering``, keyed by (model, language). Flushed together with _RLK_CACHE.
+_ORDERING_CACHE = {}
+
+
+def rewrite_default_ordering(model):
+    """
+    Returns model's default ordering (``Meta.ordering``) rewritten for the active language.
+    """
+    cache_key = (model, get_language())
+    try:
+        return _ORDERING_CACHE[cache_key]
+    except KeyError:
+        pass
+    ordering = tuple(rewrite_order_lookup_key(model, key) for key in model._meta.ordering)
+    _ORDERING_CACHE[cache_key] = ordering
+    return ordering
+
+
+def clear_rewrite_cache():
+    """
+    Forget all cached lookup key rewrites (and the related models mapping they rely on).
+
+    Called by ``Translator.register`` and ``Translator.unregister``.
+    """
+    _RLK_CACHE.clear()
+    _ORDERING_CACHE.clear()
+    _F2TM_CACHE.clear()
+
+
 def rewrite_lookup_key(model, lookup_key):
+    cache_key = (model, lookup_key, get_language())
+    try:
+        return _RLK_CACHE[cache_key]
+    except KeyError:
+        pass
+    new_key = _rewrite_lookup_key(model, lookup_key, cache_key[2])
+    if len(_RLK_CACHE) >= _RLK_CACHE_SIZE:
+        _RLK_CACHE.clear()
+    _RLK_CACHE[cache_key] = new_key
+    return new_key
+
+
+def _rewrite_lookup_key(model, lookup_key, lang):
     pieces = lookup_key.split('__', 1)
     original_key = pieces[0]
 
@@ -57,7 +124,7 @@ def rewrite_lookup_key(model, lookup_key):
         # we want to rewrite it to the actual field name
         # For example, we want to rewrite "name__startswith" to "name_fr__startswith"
         if pieces[0] in translatable_fields:
-            pieces[0] = build_localized_fieldname(pieces[0], get_language())
+            pieces[0] = build_localized_fieldname(pieces[0], lang)
 
     if len(pieces) > 1:
         # Check if we are doing a lookup to a related trans model
@@ -65,7 +132,7 @@ def rewrite_lookup_key(model, lookup_key):
         # Check ``original key``, as pieces[0] may have been already rewritten.
         if original_key in fields_to_trans_models:
             transmodel = fields_to_trans_models[original_key]
-            pieces[1] = rewrite_lookup_key(transmodel, pieces[1])
+            pieces[1] = _rewrite_lookup_key(transmodel, pieces[1], lang)
     return '__'.join(pieces)
 
 
@@ -76,25 +143,64 @@ def append_fallback(model, fields):
     """
     fields = set(fields)
     trans = set()
-    from modeltranslation.translator import translator
-    opts = translator.get_options_for_model(model)
-    for key, _ in opts.fields.items():
+    meta = get_translation_meta(model)
+    lang = get_language()
+    for key in meta.fields:
         if key in fields:
-            langs = resolution_order(get_language(), getattr(model, key).fallback_languages)
-            fields = fields.union(build_localized_fieldname(key, lang) for lang in langs)
+            fields.update(meta.fallback_names(key, lang))
             fields.remove(key)
             trans.add(key)
     return fields, trans
 
 
+if QUERY_EXPRESSIONS:
+    class NullIf(Func):
+        """
+        ``NULLIF(expression, value)`` - NULL when expression equals value.
+        """
+        function = 'NULLIF'
+
+
+def fallback_expression(model, field_name):
+    """
+    Compiles fallback resolution of translated field into a database expression, for the current
+    language: ``COALESCE(NULLIF(title_de, ''), NULLIF(title_en, ''), <fallback value>)``.
+
+    Translations equal to the undefined value are skipped (only NULL ones, if the undefined value
+    is the result of a callable default); the fallback value or field's default closes the chain.
+    """
+    if not QUERY_EXPRESSIONS:
+        raise NotImplementedError('Database-side fallbacks require Django 1.8 or newer.')
+    descriptor = getattr(model, field_name)
+    field = descriptor.field
+    output_field = field.rel.get_related_field() if field.rel else field
+    undefined = descriptor._undefined
+    if isinstance(undefined, Promise):
+        undefined = force_text(undefined)
+    expressions = []
+    for name, _ in descriptor.fallback_chain(get_language()):
+        if undefined is NONE or undefined is None:
+            expressions.append(F(name))
+        else:
+            expressions.append(NullIf(F(name), Value(undefined), output_field=output_field))
+    if descriptor.missing_value_is_static():
+        missing = descriptor.missing_value(None)
+        if isinstance(missing, Promise):
+            missing = force_text(missing)
+        if missing is not None:
+            expressions.append(Value(missing))
+    if len(expressions) == 1:
+        return expressions[0]
+    return Coalesce(*expressions, output_field=output_field)
+
+
 def append_translated(model, fields):
     "If translated field is encountered, add also all its translation fields."
     fields = set(fields)
-    from modeltranslation.translator import translator
-    opts = translator.get_options_for_model(model)
-    for key, translated in opts.fields.items():
-        if key in fields:
-            fields = fields.union(f.name for f in translated)
+    localized = get_translation_meta(model).localized
+    for key in list(fields):
+        if key in localized:
+            fields.update(localized[key])
     return fields
 
 
@@ -120,12 +226,37 @@ def append_lookup_keys(model, fields):
     return moves.reduce(set.union, (append_lookup_key(model, field) for field in fields), set())
 
 
+def fallback_lookup_keys(model, lookup_key):
+    """
+    Returns lookup keys following ``lookup_key`` through every language the active language falls
+    back to: each translated field on the path is replaced by its fallback fields, in order.
+
+    For example, with "de" active and falling back to "en", ``fk__other_fk`` gives
+    ``fk_de__other_fk_de``, ``fk_de__other_fk_en``, ``fk_en__other_fk_de``, ``fk_en__other_fk_en``.
+    """
+    from modeltranslation.translator import NotRegistered
+    pieces = lookup_key.split('__', 1)
+    try:
+        heads = get_translation_meta(model).fallback_names(pieces[0], get_language())
+    except (NotRegistered, KeyError):
+        heads = (pieces[0],)
+    if len(pieces) == 1:
+        return list(heads)
+    transmodel = get_fields_to_translatable_models(model).get(pieces[0])
+    tails = [pieces[1]] if transmodel is None else fallback_lookup_keys(transmodel, pieces[1])
+    return ['%s__%s' % (head, tail) for head in heads for tail in tails]
+
+
 def rewrite_order_lookup_key(model, lookup_key):
+    if not isinstance(lookup_key, six.string_types):
+        # Query expression (Django >= 1.8)
+        return lookup_key
     if lookup_key.startswith('-'):
         return '-' + rewrite_lookup_key(model, lookup_key[1:])
     else:
         return rewrite_lookup_key(model, lookup_key)
 
+
 _F2TM_CACHE = {}
 
 
@@ -187,14 +318,14 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _post_init(self):
         self._rewrite = True
         self._populate = None
+        self._sql_fallbacks = False
+        self._lean = None
+        self._related_fallbacks = False
         if self.model and (not self.query.order_by):
             if self.model._meta.ordering:
                 # If we have default ordering specified on the model, set it now so that
                 # it can be rewritten. Otherwise sql.compiler will grab it directly from _meta
-                ordering = []
-                for key in self.model._meta.ordering:
-                    ordering.append(rewrite_order_lookup_key(self.model, key))
-                self.query.add_ordering(*ordering)
+                self.query.add_ordering(*rewrite_default_ordering(self.model))
 
     def __reduce__(self):
         return multilingual_queryset_factory, (self.__class__.__bases__[0],), self.__getstate__()
@@ -204,6 +335,9 @@ class MultilingualQuerySet(models.query.QuerySet):
         def _clone(self, klass=None, **kwargs):
             kwargs.setdefault('_rewrite', self._rewrite)
             kwargs.setdefault('_populate', self._populate)
+            kwargs.setdefault('_sql_fallbacks', self._sql_fallbacks)
+            kwargs.setdefault('_lean', self._lean)
+            kwargs.setdefault('_related_fallbacks', self._related_fallbacks)
             if hasattr(self, 'translation_fields'):
                 kwargs.setdefault('translation_fields', self.translation_fields)
             if hasattr(self, 'fields_to_del'):
@@ -213,13 +347,13 @@ class MultilingualQuerySet(models.query.QuerySet):
             return super(MultilingualQuerySet, self)._clone(**kwargs)
     else:
         def _clone(self, klass=None, *args, **kwargs):
-            if klass is not None and not issubclass(klass, MultilingualQuerySet):
-                class NewClass(klass, MultilingualQuerySet):
-                    pass
-                NewClass.__name__ = 'Multilingual%s' % klass.__name__
-                klass = NewClass
+            if klass is not None:
+                klass = multilingual_queryset_factory(klass, instantiate=False)
             kwargs.setdefault('_rewrite', self._rewrite)
             kwargs.setdefault('_populate', self._populate)
+            kwargs.setdefault('_sql_fallbacks', self._sql_fallbacks)
+            kwargs.setdefault('_lean', self._lean)
+            kwargs.setdefault('_related_fallbacks', self._related_fallbacks)
             return super(MultilingualQuerySet, self)._clone(klass, *args, **kwargs)
 
     # This method was not present in django-linguo
@@ -233,30 +367,211 @@ class MultilingualQuerySet(models.query.QuerySet):
         """
         return self._clone(_populate=mode)
 
+    # This method was not present in django-linguo
+    def sql_fallbacks(self, mode=True):
+        """
+        Makes ``values()`` and ``values_list()`` resolve fallbacks of translated fields in the
+        database (see ``fallback_expression``), returning one column per translated field instead
+        of fetching every language column.
+        """
+        return self._clone(_sql_fallbacks=mode)
+
+    # This method was not present in django-linguo
+    def lean(self, mode=True):
+        """
+        Makes instances load only translation fields (and their ``_last_modified`` fields) of the
+        active language and its fallback languages, as of when the queryset is evaluated. Other
+        languages columns are deferred (loaded on access, like with ``defer``).
+        """
+        return self._clone(_lean=mode)
+
+    # This method was not present in django-linguo
+    def related_fallbacks(self, mode=True):
+        """
+        Makes subsequent ``select_related`` calls join translated foreign keys in every language
+        of the active language's fallback chain, so that related objects reached through a
+        fallback are loaded by the same query. Subsequent ``prefetch_related`` calls collect
+        objects whose translated foreign keys point back through fallbacks likewise.
+        """
+        return self._clone(_related_fallbacks=mode)
+
+    @property
+    def _lean_mode(self):
+        # Lean mode can be set using a global setting or a manager method.
+        if self._lean is None:
+            return settings.LEAN_QUERYSETS
+        return self._lean
+
+    def _lean_deferred(self):
+        """
+        Returns columns that lean mode doesn't load in the active language and that aren't
+        deferred yet.
+        """
+        if not self._lean_mode:
+            return set()
+        if NEW_RELATED_API:
+            if self._iterable_class is not ModelIterable:
+                return set()
+        elif isinstance(self, ValuesQuerySet):
+            return set()
+        from modeltranslation.translator import NotRegistered
+        try:
+            meta = get_translation_meta(self.model)
+        except NotRegistered:
+            return set()
+        lang = get_language()
+        deferred = set()
+        for field_name, names in meta.localized.items():
+            needed = meta.fallback_names(field_name, lang)
+            for name in names:
+                if name not in needed:
+                    deferred.add(name)
+                    if name in meta.tracked:
+                        deferred.add('{0}_last_modified'.format(name))
+        if isinstance(self.query.select_related, dict):
+            # Joined foreign keys can't be deferred
+            deferred -= set(self.query.select_related)
+        existing, defer = self.query.deferred_loading
+        if defer:
+            return deferred - existing
+        # Only loading some fields, take those out of them
+        return deferred & existing
+
+    def iterator(self):
+        deferred = self._lean_deferred()
+        if not deferred:
+            return super(MultilingualQuerySet, self).iterator()
+        clone = self._clone()
+        clone.query.add_deferred_loading(deferred)
+        return clone.iterator()
+
+    def _fetch_all(self):
+        if self._result_cache is None and self._lean_deferred():
+            # iterator() defers on a clone, so that this queryset (and its clones) can still be
+            # evaluated in another language.
+            self._result_cache = list(self.iterator())
+        super(MultilingualQuerySet, self)._fetch_all()
+
+    def filled(self, lang=None):
+        """
+        Filters instances whose translation fields are all filled in ``lang`` (the active
+        language by default), using the ``translations_filled_<lang>`` column if the model was
+        registered with ``track_filled``.
+        """
+        return self.filter(self._filled_q(lang))
+
+    def unfilled(self, lang=None):
+        """
+        Filters instances with some translation field missing in ``lang`` (see ``filled``).
+        """
+        return self.exclude(self._filled_q(lang))
+
+    def _filled_q(self, lang):
+        lang = lang or get_language()
+        name = filled_field_name(lang)
+        if name in set(f.name for f in self.model._meta.concrete_fields):
+            return models.Q(**{name: True})
+        from modeltranslation.translator import translator
+        fields = translator.get_options_for_model(self.model).fields
+        return filled_q(self.model, fields, lang)
+
+    def _annotate_fallbacks(self, names, select=False):
+        """
+        Returns a clone annotated with fallback expressions for the translated fields among
+        ``names``, named after the fields. The annotations are added to the SELECT clause only if
+        ``select`` is true.
+        """
+        meta = get_translation_meta(self.model)
+        names = [name for name in names if name in meta.fields]
+        if not names:
+            return self
+        clone = self._clone()
+        query = clone.query
+        selected = list(query.annotation_select)
+        for name in names:
+            if name not in query.annotations:
+                query.add_annotation(fallback_expression(self.model, name), name)
+        query.set_annotation_mask(selected + names if select else selected)
+        return clone
+
+    def _fallback_field(self, key):
+        """
+        Returns the name of the translated field ``key`` (a lookup or ordering key) refers to, if
+        it is resolved by a fallback annotation - otherwise ``None``.
+        """
+        if not self._sql_fallbacks or not isinstance(key, six.string_types):
+            return None
+        name = key.lstrip('-').split('__', 1)[0]
+        if name in get_translation_meta(self.model).fields and not getattr(
+                self.model, name).field.rel:
+            return name
+        return None
+
+    def _rewrite_key(self, key):
+        if self._fallback_field(key):
+            return key
+        return rewrite_lookup_key(self.model, key)
+
     def _rewrite_applied_operations(self):
         """
         Rewrite fields in already applied filters/ordering.
         Useful when converting any QuerySet into MultilingualQuerySet.
         """
-        self._rewrite_where(self.query.where)
-        if not NEW_RELATED_API:
-            self._rewrite_where(self.query.having)
-        self._rewrite_order()
-        self._rewrite_select_related()
+        query = self.query
+        # Skip walking parts of the query that are empty - it's the case for most querysets
+        # coming straight from a manager.
+        if query.where.children:
+            self._rewrite_where(query.where)
+        if not NEW_RELATED_API and query.having.children:
+            self._rewrite_where(query.having)
+        if query.order_by:
+            self._rewrite_order()
+        if query.select_related:
+            self._rewrite_select_related()
 
     # This method was not present in django-linguo
     def select_related(self, *fields, **kwargs):
         if not self._rewrite:
             return super(MultilingualQuerySet, self).select_related(*fields, **kwargs)
-        # TO CONSIDER: whether this should rewrite only current language, or all languages?
-        # fk -> [fk, fk_en] (with en=active) VS fk -> [fk, fk_en, fk_de, fk_fr ...] (for all langs)
-
-        # new_args = append_lookup_keys(self.model, fields)
+        # Only the active language is joined, unless fallbacks were asked for:
+        # fk -> [fk_en] (with en=active) VS fk -> [fk_en, fk_de] (en falling back to de)
         new_args = []
         for key in fields:
-            new_args.append(rewrite_lookup_key(self.model, key))
+            if self._related_fallbacks:
+                new_args.extend(fallback_lookup_keys(self.model, key))
+            else:
+                new_args.append(rewrite_lookup_key(self.model, key))
         return super(MultilingualQuerySet, self).select_related(*new_args, **kwargs)
 
+    # This method was not present in django-linguo
+    def prefetch_related(self, *lookups):
+        if self._related_fallbacks and Prefetch is not None:
+            lookups = self._fallback_prefetch_lookups(lookups)
+        return super(MultilingualQuerySet, self).prefetch_related(*lookups)
+
+    def _fallback_prefetch_lookups(self, lookups):
+        """
+        Replaces reverse accessors of translated ForeignKeys with prefetches of objects related
+        through every fallback language, in a single query per accessor.
+        """
+        seen = set(getattr(lookup, 'prefetch_to', lookup)
+                   for lookup in self._prefetch_related_lookups)
+        new_lookups = []
+        for lookup in lookups:
+            if isinstance(lookup, six.string_types):
+                accessor = lookup.split('__', 1)[0]
+                descriptor = getattr(self.model, accessor, None)
+                if (isinstance(descriptor, LanguageFallbackRelatedObjectsDescriptor) and
+                        accessor not in seen):
+                    seen.add(accessor)
+                    related_model = descriptor.translated_field.model
+                    new_lookups.append(Prefetch(
+                        accessor, queryset=related_model._default_manager.related_fallbacks()))
+                    if lookup == accessor:
+                        continue
+            new_lookups.append(lookup)
+        return new_lookups
+
     # This method was not present in django-linguo
     def _rewrite_col(self, col):
         """Django >= 1.7 column name rewriting"""
@@ -305,7 +620,7 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _rewrite_q(self, q):
         """Rewrite field names inside Q call."""
         if isinstance(q, tuple) and len(q) == 2:
-            return rewrite_lookup_key(self.model, q[0]), q[1]
+            return self._rewrite_key(q[0]), q[1]
         if isinstance(q, Node):
             q.children = list(map(self._rewrite_q, q.children))
         return q
@@ -327,15 +642,37 @@ class MultilingualQuerySet(models.query.QuerySet):
             q.rhs = self._rewrite_f(q.rhs)
         return q
 
+    def _q_keys(self, q):
+        """Yields lookup keys used inside Q call."""
+        if isinstance(q, tuple) and len(q) == 2:
+            yield q[0]
+        elif isinstance(q, Node):
+            for child in q.children:
+                for key in self._q_keys(child):
+                    yield key
+
     def _filter_or_exclude(self, negate, *args, **kwargs):
         if not self._rewrite:
             return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
+        qs, names = self, ()
+        if self._sql_fallbacks:
+            keys = itertools.chain(kwargs, *map(self._q_keys, args))
+            names = set(filter(None, map(self._fallback_field, keys)))
+            names.difference_update(self.query.annotations)
+            qs = self._annotate_fallbacks(names)
         args = map(self._rewrite_q, args)
         for key, val in list(kwargs.items()):
-            new_key = rewrite_lookup_key(self.model, key)
+            new_key = self._rewrite_key(key)
             del kwargs[key]
             kwargs[new_key] = self._rewrite_f(val)
-        return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
+        clone = super(MultilingualQuerySet, qs)._filter_or_exclude(negate, *args, **kwargs)
+        if names:
+            # Lookups embed the fallback expressions, the annotations were needed only to resolve
+            # them. Unselected annotations would break count() and aggregate() on Django 1.8.
+            for name in names:
+                del clone.query.annotations[name]
+            clone.query.set_annotation_mask(clone.query.annotation_select_mask)
+        return clone
 
     def _get_original_fields(self):
         source = (self.model._meta.concrete_fields if hasattr(self.model._meta, 'concrete_fields')
@@ -345,13 +682,19 @@ class MultilingualQuerySet(models.query.QuerySet):
     def order_by(self, *field_names):
         """
         Change translatable field names in an ``order_by`` argument
-        to translation fields for the current language.
+        to translation fields for the current language (or to fallback
+        expressions in ``sql_fallbacks`` mode).
         """
         if not self._rewrite:
             return super(MultilingualQuerySet, self).order_by(*field_names)
         new_args = []
         for key in field_names:
-            new_args.append(rewrite_order_lookup_key(self.model, key))
+            name = self._fallback_field(key)
+            if name and key.lstrip('-') == name:
+                expression = fallback_expression(self.model, name)
+                new_args.append(expression.desc() if key.startswith('-') else expression.asc())
+            else:
+                new_args.append(rewrite_order_lookup_key(self.model, key))
         return super(MultilingualQuerySet, self).order_by(*new_args)
 
     def update(self, **kwargs):
@@ -419,6 +762,9 @@ class MultilingualQuerySet(models.query.QuerySet):
         if not fields:
             # Emulate original queryset behaviour: get all fields that are not translation fields
             fields = self._get_original_fields()
+        if self._sql_fallbacks:
+            clone = self._annotate_fallbacks(fields, select=True)
+            return super(MultilingualQuerySet, clone).values(*fields)
         if NEW_RELATED_API:
             clone = self._values(*fields, prepare=True)
             clone._iterable_class = FallbackValuesIterable
@@ -439,6 +785,9 @@ class MultilingualQuerySet(models.query.QuerySet):
         if not fields:
             # Emulate original queryset behaviour: get all fields that are not translation fields
             fields = self._get_original_fields()
+        if self._sql_fallbacks:
+            clone = self._annotate_fallbacks(fields, select=True)
+            return super(MultilingualQuerySet, clone).values_list(*fields, flat=flat)
         if NEW_RELATED_API:
             clone = self._values(*fields, prepare=True)
             clone._iterable_class = (FallbackFlatValuesListIterable if flat
@@ -456,28 +805,91 @@ class MultilingualQuerySet(models.query.QuerySet):
         return super(MultilingualQuerySet, self).dates(new_key, *args, **kwargs)
 
 
+class FallbackValuesResolver(object):
+    """
+    Resolves translated fields with fallbacks on raw value rows.
+
+    Built once per queryset evaluation: for every output key it precomputes the positions of its
+    source columns in the fetched rows (for translated fields - the localized columns in the
+    order of fallback resolution), so rows are resolved with plain index lookups instead of
+    feeding them through the field descriptors.
+    """
+    def __init__(self, model, names, keys, translation_fields):
+        """
+        ``names`` are the column names of the fetched rows, ``keys`` the names of the values to
+        resolve (in order), ``translation_fields`` the keys that have to be resolved with
+        fallbacks.
+        """
+        index = dict((name, i) for i, name in enumerate(names))
+        lang = get_language()
+        plan = []
+        for key in keys:
+            if key not in translation_fields:
+                plan.append(index[key])
+                continue
+            descriptor = getattr(model, key)
+            sources = tuple(index[name] for name, _ in descriptor.fallback_chain(lang)
+                            if name in index)
+            undefined = descriptor._undefined
+            if undefined is NONE:
+                undefined = descriptor.field.get_default()
+            if descriptor.missing_value_is_static():
+                missing = descriptor.missing_value(None)
+                plan.append((sources, undefined, missing, None))
+            else:
+                plan.append((sources, undefined, None, descriptor))
+        self.plan = tuple(plan)
+
+    def resolve(self, rows):
+        """
+        Yields a list of resolved values for every row of ``rows``.
+        """
+        plan = self.plan
+        for row in rows:
+            values = []
+            append = values.append
+            for entry in plan:
+                if entry.__class__ is int:
+                    append(row[entry])
+                    continue
+                sources, undefined, val, descriptor = entry
+                for i in sources:
+                    if row[i] is not None and row[i] != undefined:
+                        val = row[i]
+                        break
+                else:
+                    if descriptor is not None:
+                        val = descriptor.missing_value(None)
+                append(val)
+            yield values
+
+
 if NEW_RELATED_API:
     class FallbackValuesIterable(ValuesIterable):
-        class X(object):
-            # This stupid class is needed as object use __slots__ and has no __dict__.
-            pass
+        def _row_names(self):
+            query = self.queryset.query
+            return (list(query.extra_select) + list(query.values_select) +
+                    list(query.annotation_select))
+
+        def resolve(self, keys):
+            queryset = self.queryset
+            resolver = FallbackValuesResolver(queryset.model, self._row_names(), keys,
+                                              queryset.translation_fields)
+            return resolver.resolve(queryset.query.get_compiler(queryset.db).results_iter())
 
         def __iter__(self):
-            instance = self.X()
-            for row in super(FallbackValuesIterable, self).__iter__():
-                instance.__dict__.update(row)
-                for key in self.queryset.translation_fields:
-                    row[key] = getattr(self.queryset.model, key).__get__(instance, None)
-                for key in self.queryset.fields_to_del:
-                    del row[key]
-                yield row
+            fields_to_del = self.queryset.fields_to_del
+            keys = [name for name in self._row_names() if name not in fields_to_del]
+            keys.extend(self.queryset.translation_fields)
+            for values in self.resolve(keys):
+                yield dict(zip(keys, values))
 
     class FallbackValuesListIterable(FallbackValuesIterable):
         def __iter__(self):
             fields = self.queryset.original_fields
             fields += tuple(f for f in self.queryset.query.annotation_select if f not in fields)
-            for row in super(FallbackValuesListIterable, self).__iter__():
-                yield tuple(row[f] for f in fields)
+            for values in self.resolve(fields):
+                yield tuple(values)
 
     class FallbackFlatValuesListIterable(FallbackValuesListIterable):
         def __iter__(self):
@@ -493,19 +905,25 @@ else:
             self.fields_to_del = new_fields - set(original)
             super(FallbackValuesQuerySet, self)._setup_query()
 
-        class X(object):
-            # This stupid class is needed as object use __slots__ and has no __dict__.
-            pass
+        def _row_names(self):
+            query = self.query
+            if hasattr(query, 'annotation_select'):
+                # Django >=1.8
+                annotation_names = list(query.annotation_select)
+            else:
+                annotation_names = list(query.aggregate_select)
+            return list(query.extra_select) + list(self.field_names) + annotation_names
+
+        def resolve(self, keys):
+            resolver = FallbackValuesResolver(self.model, self._row_names(), keys,
+                                              self.translation_fields)
+            return resolver.resolve(self.query.get_compiler(self.db).results_iter())
 
         def iterator(self):
-            instance = self.X()
-            for row in super(FallbackValuesQuerySet, self).iterator():
-                instance.__dict__.update(row)
-                for key in self.translation_fields:
-                    row[key] = getattr(self.model, key).__get__(instance, None)
-                for key in self.fields_to_del:
-                    del row[key]
-                yield row
+            keys = [name for name in self._row_names() if name not in self.fields_to_del]
+            keys.extend(self.translation_fields)
+            for values in self.resolve(keys):
+                yield dict(zip(keys, values))
 
         def _clone(self, klass=None, setup=False, **kwargs):
             c = super(FallbackValuesQuerySet, self)._clone(klass, **kwargs)
@@ -524,11 +942,12 @@ else:
             if hasattr(self, 'annotation_names'):
                 # Django >=1.8
                 fields += tuple(f for f in self.annotation_names if f not in fields)
-            for row in super(FallbackValuesListQuerySet, self).iterator():
-                if self.flat and len(fields) == 1:
-                    yield row[fields[0]]
+            flat = self.flat and len(fields) == 1
+            for values in self.resolve(fields):
+                if flat:
+                    yield values[0]
                 else:
-                    yield tuple(row[f] for f in fields)
+                    yield tuple(values)
 
         def _setup_query(self):
             self.original_fields = tuple(self._fields)
@@ -550,13 +969,25 @@ def get_queryset(obj):
         return obj.get_query_set()
 
 
+# QuerySet class -> its Multilingual subclass. Creating classes is costly and every new class
+# starts with cold method caches, so each QuerySet class is subclassed once. QuerySet classes are
+# defined once, so entries live for the whole process.
+_QUERYSET_CLASSES = {}
+
+
 def multilingual_queryset_factory(old_cls, instantiate=True):
     if old_cls == models.query.QuerySet:
         NewClass = MultilingualQuerySet
+    elif issubclass(old_cls, MultilingualQuerySet):
+        NewClass = old_cls
     else:
-        class NewClass(old_cls, MultilingualQuerySet):
-            pass
-        NewClass.__name__ = 'Multilingual%s' % old_cls.__name__
+        try:
+            NewClass = _QUERYSET_CLASSES[old_cls]
+        except KeyError:
+            class NewClass(old_cls, MultilingualQuerySet):
+                pass
+            NewClass.__name__ = 'Multilingual%s' % old_cls.__name__
+            NewClass = _QUERYSET_CLASSES.setdefault(old_cls, NewClass)
     return NewClass() if instantiate else NewClass
 
 
@@ -571,8 +1002,9 @@ class MultilingualQuerysetManager(models.Manager):
 
     def _patch_queryset(self, qs):
         qs.__class__ = multilingual_queryset_factory(qs.__class__, instantiate=False)
-        qs._post_init()
+        # Rewrite first: default ordering added by _post_init is rewritten already.
         qs._rewrite_applied_operations()
+        qs._post_init()
         return qs
 
     get_query_set = get_queryset
@@ -590,6 +1022,21 @@ class MultilingualManager(MultilingualQuerysetManager):
     def raw_values(self, *args, **kwargs):
         return self.get_queryset().raw_values(*args, **kwargs)
 
+    def sql_fallbacks(self, *args, **kwargs):
+        return self.get_queryset().sql_fallbacks(*args, **kwargs)
+
+    def lean(self, *args, **kwargs):
+        return self.get_queryset().lean(*args, **kwargs)
+
+    def related_fallbacks(self, *args, **kwargs):
+        return self.get_queryset().related_fallbacks(*args, **kwargs)
+
+    def filled(self, *args, **kwargs):
+        return self.get_queryset().filled(*args, **kwargs)
+
+    def unfilled(self, *args, **kwargs):
+        return self.get_queryset().unfilled(*args, **kwargs)
+
     def get_queryset(self):
         """
         This method is repeated because some managers that don't use super() or alter queryset class
@@ -13,6 +13,7 @@ def autodiscover():
     import copy
     from django.conf import settings
     from django.utils.module_loading import module_has_submodule
+    from modeltranslation.manager import clear_rewrite_cache
     from modeltranslation.translator import translator
     from modeltranslation.settings import TRANSLATION_FILES, DEBUG
 
@@ -35,6 +36,7 @@ def autodiscover():
             # this import will have to reoccur on the next request and this
             # could raise NotRegistered and AlreadyRegistered exceptions
             translator._registry = before_import_registry
+            clear_rewrite_cache()
 
             # Decide whether to bubble up this error. If the app just
             # doesn't have an translation module, we can ignore the error
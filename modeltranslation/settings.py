@@ -54,3 +54,24 @@ for key, value in FALLBACK_LANGUAGES.items():
 ENABLE_FALLBACKS = getattr(settings, 'MODELTRANSLATION_ENABLE_FALLBACKS', True)
 
 LOADDATA_RETAIN_LOCALE = getattr(settings, 'MODELTRANSLATION_LOADDATA_RETAIN_LOCALE', True)
+
+# Maintain translation panel statistics in the TranslationCoverage table instead of computing them
+# on every page load. The table comes with the optional ``modeltranslation.coverage`` app.
+COVERAGE_STORE = getattr(settings, 'MODELTRANSLATION_COVERAGE_STORE', False)
+COVERAGE_INSTALLED = any(app.startswith('modeltranslation.coverage')
+                         for app in settings.INSTALLED_APPS)
+if COVERAGE_STORE and not COVERAGE_INSTALLED:
+    raise ImproperlyConfigured(
+        'MODELTRANSLATION_COVERAGE_STORE requires "modeltranslation.coverage" in INSTALLED_APPS.')
+
+# Cache alias holding translation panel statistics precomputed by the
+# precompute_translation_stats command, None computes them on page load.
+PANEL_STATS_CACHE = getattr(settings, 'MODELTRANSLATION_PANEL_STATS_CACHE', None)
+
+# Number of threads counting translation panel statistics of different models concurrently,
+# 0 counts them one after another.
+PANEL_STATS_THREADS = getattr(settings, 'MODELTRANSLATION_PANEL_STATS_THREADS', 0)
+
+# Make querysets of translated models defer translation fields of languages that aren't
+# needed in the active language (see MultilingualQuerySet.lean).
+LEAN_QUERYSETS = getattr(settings, 'MODELTRANSLATION_LEAN_QUERYSETS', False)
@@ -0,0 +1,713 @@
+# -*- coding: utf-8 -*-
+"""
+Translation status statistics, computed in the database.
+
+An instance is considered translated (up to date) in a language when every checked field was
+modified later than ``UPDATE_MARGIN`` after its default language version.
+"""
+import csv
+import datetime
+import json
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+
+from django.db import connections, router
+from django.db.models import Count, F, Q
+try:
+    from django.core.exceptions import EmptyResultSet
+except ImportError:
+    # Django < 1.11
+    from django.db.models.sql.datastructures import EmptyResultSet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import six, timezone
+from django.utils.encoding import force_str
+try:
+    from django.db.models import Case, IntegerField, Sum, Value, When
+    CONDITIONAL_EXPRESSIONS = True  # Django 1.8
+except ImportError:
+    CONDITIONAL_EXPRESSIONS = False
+
+from modeltranslation import settings as mt_settings
+from modeltranslation.utils import build_localized_fieldname
+
+
+UPDATE_MARGIN = datetime.timedelta(seconds=30)
+
+
+def last_modified_name(field_name, lang):
+    return '{0}_last_modified'.format(build_localized_fieldname(field_name, lang))
+
+
+def updated_filters(fields, lang):
+    """
+    Returns lookups matching instances whose ``fields`` are up to date in ``lang``.
+    """
+    filters = {}
+    for field in fields:
+        last_modified = last_modified_name(field, lang)
+        last_modified_default = last_modified_name(field, mt_settings.DEFAULT_LANGUAGE)
+        # It is updated if the last_modified is gt the default one
+        filters['{0}__gt'.format(last_modified)] = F(last_modified_default) + UPDATE_MARGIN
+    return filters
+
+
+def translation_stats(queryset, fields, languages=None):
+    """
+    Counts instances of ``queryset`` that are translated / still to translate in every language
+    of ``languages`` (all available languages by default), taking ``fields`` into account::
+
+        {'de': {'translated': 10, 'to_translate': 2, 'total': 12}, ...}
+
+    On Django >= 1.8 all numbers are computed with a single aggregate query.
+    """
+    if languages is None:
+        languages = mt_settings.AVAILABLE_LANGUAGES
+    if not CONDITIONAL_EXPRESSIONS:
+        total = queryset.count()
+        stats = {}
+        for lang in languages:
+            translated = queryset.filter(**updated_filters(fields, lang)).count()
+            stats[lang] = {'translated': translated, 'to_translate': total - translated,
+                           'total': total}
+        return stats
+
+    aggregates = {'total': Count('pk')}
+    for i, lang in enumerate(languages):
+        filters = updated_filters(fields, lang)
+        if filters:
+            aggregates['translated_%d' % i] = Sum(Case(
+                When(Q(**filters), then=Value(1)), default=Value(0), output_field=IntegerField()))
+    result = queryset.aggregate(**aggregates)
+    total = result['total']
+    stats = {}
+    for i, lang in enumerate(languages):
+        # Sum over no rows is NULL, no fields to check means everything is translated
+        translated = result.get('translated_%d' % i, total) or 0
+        stats[lang] = {'translated': translated, 'to_translate': total - translated,
+                       'total': total}
+    return stats
+
+
+def model_translation_stats(model, languages=None):
+    """
+    Translation statistics of the translation queryset of a registered model, taking its
+    translation fields into account (see ``TranslationOptions.get_translation_queryset`` and
+    ``TranslationOptions.get_translation_fields``).
+    """
+    from modeltranslation.translator import translator
+    opts = translator.get_options_for_model(model)
+    queryset = opts.get_translation_queryset(model._default_manager.all())
+    return translation_stats(queryset, opts.get_translation_fields(), languages)
+
+
+def estimated_count(queryset):
+    """
+    Estimates the number of instances of ``queryset`` from the query planner statistics on
+    PostgreSQL (the query isn't run). Other databases count them.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    cursor = connection.cursor()
+    try:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    if isinstance(plan, six.string_types):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimated_translation_stats(queryset, fields, languages=None):
+    """
+    Same as ``translation_stats``, but estimates the numbers (see ``estimated_count``). Other
+    databases than PostgreSQL get exact numbers.
+    """
+    if connections[queryset.db].vendor != 'postgresql':
+        return translation_stats(queryset, fields, languages)
+    if languages is None:
+        languages = mt_settings.AVAILABLE_LANGUAGES
+    total = estimated_count(queryset)
+    stats = {}
+    for lang in languages:
+        filters = updated_filters(fields, lang)
+        translated = min(estimated_count(queryset.filter(**filters)), total) if filters else total
+        stats[lang] = {'translated': translated, 'to_translate': total - translated,
+                       'total': total}
+    return stats
+
+
+# ######### Per instance status
+
+# Status flags of a translation field of an instance, see ``status_expression``
+STATUS_MISSING = 1
+STATUS_EQUAL = 2
+STATUS_UPDATED = 4
+
+
+def status_label(flags):
+    """
+    Returns the label of status ``flags`` used by the translations panel (as returned by the
+    ``is_uptodate`` template tag).
+    """
+    labels = []
+    if flags & STATUS_MISSING:
+        labels.append('missing')
+    if flags & STATUS_EQUAL:
+        labels.append('equal')
+    labels.append('updated' if flags & STATUS_UPDATED else 'not-updated')
+    return ' '.join(labels)
+
+
+STATUS_LABELS = dict((flags, status_label(flags)) for flags in range(8))
+
+
+def is_empty(value):
+    """
+    Tells if a translation ``value`` is missing, i.e. ``None`` or an empty string (``0`` or
+    ``False`` are translations), as in ``status_expression``.
+    """
+    return value is None or value == ''
+
+
+def status_name(field_name, lang):
+    """
+    Name of the annotation holding the status flags of ``field_name`` translation in ``lang``.
+    """
+    return '{0}_status'.format(build_localized_fieldname(field_name, lang))
+
+
+def status_expression(model, field_name, lang):
+    """
+    Database expression computing status flags of ``field_name`` translation in ``lang``:
+    ``STATUS_MISSING`` if it is empty while the default language one is not, ``STATUS_EQUAL`` if
+    it equals the default language one and ``STATUS_UPDATED`` if it was modified later than
+    ``UPDATE_MARGIN`` after it (or if changes of the field are not monitored).
+    """
+    field_lang = build_localized_fieldname(field_name, lang)
+    field_default = build_localized_fieldname(field_name, mt_settings.DEFAULT_LANGUAGE)
+
+    def empty(name):
+        q = Q(**{'{0}__isnull'.format(name): True})
+        if model._meta.get_field(name).empty_strings_allowed:
+            q |= Q(**{name: ''})
+        return q
+
+    def flag(condition, value):
+        return Case(When(condition, then=Value(value)), default=Value(0),
+                    output_field=IntegerField())
+
+    missing = empty(field_lang) & ~empty(field_default)
+    equal = Q(**{field_lang: F(field_default)}) | (empty(field_lang) & empty(field_default))
+    filters = updated_filters([field_name], lang)
+    last_modified = last_modified_name(field_name, lang)
+    if last_modified in set(f.name for f in model._meta.fields):
+        updated = flag(Q(**filters), STATUS_UPDATED)
+    else:
+        updated = Value(STATUS_UPDATED)
+    return flag(missing, STATUS_MISSING) + flag(equal, STATUS_EQUAL) + updated
+
+
+def annotate_translation_status(queryset, fields, lang):
+    """
+    Annotates every instance of ``queryset`` with status flags of ``fields`` translations in
+    ``lang`` (see ``status_name`` and ``status_label``). Needs Django >= 1.8 - older versions
+    get the queryset back unchanged.
+    """
+    if not CONDITIONAL_EXPRESSIONS:
+        return queryset
+    annotations = dict(
+        (status_name(field, lang), status_expression(queryset.model, field, lang))
+        for field in fields if status_name(field, lang) not in queryset.query.annotations)
+    if not annotations:
+        return queryset
+    return queryset.annotate(**annotations)
+
+
+def updated_status_q(fields, lang):
+    """
+    Q object matching instances annotated by ``annotate_translation_status`` with all ``fields``
+    translations updated.
+    """
+    updated = [flags for flags in range(8) if flags & STATUS_UPDATED]
+    q = Q()
+    for field in fields:
+        q &= Q(**{'{0}__in'.format(status_name(field, lang)): updated})
+    return q
+
+
+# ######### Coverage store
+
+def model_label(model):
+    opts = model._meta
+    try:
+        return '%s.%s' % (opts.app_label, opts.model_name)
+    except AttributeError:
+        return '%s.%s' % (opts.app_label, opts.module_name)
+
+
+def translated_languages(instance, fields, languages=None):
+    """
+    Returns the set of languages in which ``instance`` is translated (see ``updated_filters``),
+    computed from its loaded ``_last_modified`` values - or ``None`` if some of them aren't loaded.
+    """
+    return values_translated_languages(instance.__dict__, fields, languages)
+
+
+def values_translated_languages(values, fields, languages=None):
+    """
+    Same as ``translated_languages``, but reads ``_last_modified`` values from the ``values`` dict.
+    """
+    if languages is None:
+        languages = mt_settings.AVAILABLE_LANGUAGES
+    defaults = {}
+    for field in fields:
+        name = last_modified_name(field, mt_settings.DEFAULT_LANGUAGE)
+        if name not in values:
+            return None
+        defaults[field] = values[name]
+    translated = set()
+    for lang in languages:
+        for field in fields:
+            name = last_modified_name(field, lang)
+            if name not in values:
+                return None
+            if values[name] is None or defaults[field] is None or (
+                    values[name] <= defaults[field] + UPDATE_MARGIN):
+                break
+        else:
+            translated.add(lang)
+    return translated
+
+
+def coverage_models(model):
+    """
+    Returns registered models whose translation statistics count instances of ``model``: the model
+    itself and its registered concrete parents.
+    """
+    from modeltranslation.translator import translator
+    if model._deferred:
+        model = model._meta.proxy_for_model
+    return [base for base in model.__mro__
+            if hasattr(base, '_meta') and not base._meta.abstract and
+            translator._get_options_for_model(base).registered]
+
+
+def tracks_instances(model):
+    """
+    Tells if coverage of ``model`` can be updated per saved/deleted instance, which is not the case
+    if the translation queryset is customized (it could exclude some instances).
+    """
+    from modeltranslation.translator import TranslationOptions, translator
+    method = type(translator.get_options_for_model(model)).get_translation_queryset
+    return getattr(method, '__func__', method) is getattr(
+        TranslationOptions.get_translation_queryset, '__func__',
+        TranslationOptions.get_translation_queryset)
+
+
+def stored_coverage(instance):
+    """
+    Returns languages ``instance`` is translated in as stored in the database, keyed by labels of
+    ``coverage_models``. ``_last_modified`` values are read from the ones remembered when the
+    instance was loaded or saved (see ``patch_from_db``), the others with a single query.
+    """
+    from modeltranslation.translator import translator
+    snapshot = instance.__dict__.get('_mt_snapshot', {})
+    model_fields = [(model, translator.get_options_for_model(model).get_translation_fields())
+                    for model in coverage_models(instance.__class__)]
+    names = set(last_modified_name(field, lang) for _, fields in model_fields for field in fields
+                for lang in mt_settings.AVAILABLE_LANGUAGES)
+    values = dict((name, snapshot[name]) for name in names if name in snapshot)
+    missing = names - set(values)
+    if missing:
+        if instance.pk is None:
+            return {}
+        rows = list(instance.__class__._base_manager.filter(pk=instance.pk).values(*missing)[:1])
+        if not rows:
+            return {}
+        values.update(rows[0])
+    return dict((model_label(model), values_translated_languages(values, fields))
+                for model, fields in model_fields)
+
+
+def refresh_coverage(model):
+    """
+    Recomputes stored statistics of ``model`` from its translation queryset.
+    """
+    from modeltranslation.coverage.models import TranslationCoverage
+    label = model_label(model)
+    stats = model_translation_stats(model)
+    for lang, numbers in stats.items():
+        values = {'translated': numbers['translated'], 'total': numbers['total']}
+        if not TranslationCoverage.objects.filter(model=label, language=lang).update(**values):
+            TranslationCoverage.objects.create(model=label, language=lang, **values)
+    return stats
+
+
+def rebuild_coverage(models=None):
+    """
+    Rebuilds the coverage store for ``models`` (all registered models by default).
+    """
+    from modeltranslation.coverage.models import TranslationCoverage
+    from modeltranslation.translator import translator
+    if models is None:
+        models = translator.get_registered_models(abstract=False)
+        TranslationCoverage.objects.all().delete()
+    for model in models:
+        TranslationCoverage.objects.filter(model=model_label(model)).delete()
+        refresh_coverage(model)
+
+
+def coverage_stats(model, languages=None):
+    """
+    Same as ``model_translation_stats``, but reads the coverage store (filling it for ``model`` if
+    it is missing).
+    """
+    from modeltranslation.coverage.models import TranslationCoverage
+    if languages is None:
+        languages = mt_settings.AVAILABLE_LANGUAGES
+    stats = dict(
+        (row.language, {'translated': row.translated, 'to_translate': row.total - row.translated,
+                        'total': row.total})
+        for row in TranslationCoverage.objects.filter(model=model_label(model),
+                                                      language__in=languages))
+    if len(stats) < len(languages):
+        stats = refresh_coverage(model)
+    return dict((lang, stats[lang]) for lang in languages)
+
+
+def update_instance_coverage(instance, created=False, deleted=False):
+    """
+    Applies the change of a saved (or deleted) instance to the coverage store, comparing its
+    translation status with the stored one (see ``coverage_pre_save``). Models whose status can't
+    be tracked per instance are recounted.
+    """
+    from modeltranslation.coverage.models import TranslationCoverage
+    from modeltranslation.translator import translator
+    old_coverage = instance.__dict__.pop('_mt_coverage', {})
+    for model in coverage_models(instance.__class__):
+        label = model_label(model)
+        fields = translator.get_options_for_model(model).get_translation_fields()
+        new = translated_languages(instance, fields)
+        old = set() if created else old_coverage.get(label)
+        rows = TranslationCoverage.objects.filter(model=label)
+        if deleted:
+            # The database state is the remembered one, unless it isn't known
+            old = new if old is None else old
+            if old is None or not tracks_instances(model):
+                refresh_coverage(model)
+            else:
+                rows.update(total=F('total') - 1)
+                if old:
+                    rows.filter(language__in=old).update(translated=F('translated') - 1)
+            continue
+        if new is None or old is None or not tracks_instances(model):
+            refresh_coverage(model)
+            continue
+        if created:
+            rows.update(total=F('total') + 1)
+        if new - old:
+            rows.filter(language__in=new - old).update(translated=F('translated') + 1)
+        if old - new:
+            rows.filter(language__in=old - new).update(translated=F('translated') - 1)
+
+
+def _stored_coverage(model, pks):
+    """
+    Reads languages instances ``pks`` of ``model`` are translated in from the database, for every
+    model whose coverage tracks them (see ``coverage_models``).
+    """
+    from modeltranslation.translator import translator
+    coverage = {}
+    for coverage_model in coverage_models(model):
+        if not tracks_instances(coverage_model):
+            continue
+        fields = translator.get_options_for_model(coverage_model).get_translation_fields()
+        names = [last_modified_name(field, lang) for field in fields
+                 for lang in mt_settings.AVAILABLE_LANGUAGES]
+        rows = model._base_manager.filter(pk__in=pks).values('pk', *names)
+        coverage[coverage_model] = dict(
+            (row['pk'], values_translated_languages(row, fields)) for row in rows)
+    return coverage
+
+
+@contextmanager
+def tracked_coverage(model, pks):
+    """
+    Applies changes of instances ``pks`` of ``model`` made inside the block with queryset updates
+    (which don't send signals) to the coverage store::
+
+        with tracked_coverage(Model, pks):
+            Model.objects.filter(pk__in=pks).update(...)
+    """
+    if not mt_settings.COVERAGE_STORE:
+        yield
+        return
+    from modeltranslation.coverage.models import TranslationCoverage
+    before = _stored_coverage(model, pks)
+    yield
+    after = _stored_coverage(model, pks)
+    for coverage_model in coverage_models(model):
+        if coverage_model not in after:
+            refresh_coverage(coverage_model)
+            continue
+        deltas = dict((lang, 0) for lang in mt_settings.AVAILABLE_LANGUAGES)
+        for pk, new in after[coverage_model].items():
+            old = before[coverage_model].get(pk, set())
+            for lang in new - old:
+                deltas[lang] += 1
+            for lang in old - new:
+                deltas[lang] -= 1
+        rows = TranslationCoverage.objects.filter(model=model_label(coverage_model))
+        for lang, delta in deltas.items():
+            if delta:
+                rows.filter(language=lang).update(translated=F('translated') + delta)
+
+
+def coverage_pre_save(sender, instance, raw=False, **kwargs):
+    # The stored status is only needed (and read) when an instance is saved or deleted
+    if mt_settings.COVERAGE_STORE and not raw:
+        instance._mt_coverage = stored_coverage(instance)
+
+
+def coverage_post_save(sender, instance, created=False, raw=False, **kwargs):
+    if mt_settings.COVERAGE_STORE and not raw:
+        update_instance_coverage(instance, created=created)
+
+
+def coverage_pre_delete(sender, instance, **kwargs):
+    if mt_settings.COVERAGE_STORE:
+        instance._mt_coverage = stored_coverage(instance)
+
+
+def coverage_post_delete(sender, instance, **kwargs):
+    if mt_settings.COVERAGE_STORE:
+        update_instance_coverage(instance, deleted=True)
+
+
+# ######### Precomputed panel statistics
+
+PANEL_STATS_CACHE_KEY = 'modeltranslation_panel_stats'
+
+
+def panel_model_stats(model):
+    """
+    Statistics of ``model`` shown by the translation panel, read from the coverage store if it is
+    enabled.
+    """
+    if mt_settings.COVERAGE_STORE:
+        return coverage_stats(model)
+    return model_translation_stats(model)
+
+
+def _shares_data_between_threads(using):
+    """
+    Tells if other threads (with their own connections) see the same data as the current one,
+    which isn't the case inside a transaction or with an in-memory SQLite database.
+    """
+    connection = connections[using]
+    if getattr(connection, 'in_atomic_block', False):
+        return False
+    name = connection.settings_dict['NAME']
+    return not (connection.vendor == 'sqlite' and (name == ':memory:' or 'mode=memory' in name))
+
+
+def _closing_connections(func):
+    """
+    Closes the database connections of the thread ``func`` runs in, once it has run.
+    """
+    def wrapper(*args):
+        try:
+            return func(*args)
+        finally:
+            for connection in connections.all():
+                connection.close()
+    return wrapper
+
+
+def panel_stats(models, threads=None):
+    """
+    Returns ``{model: statistics}`` of ``models`` (see ``panel_model_stats``). With more than one
+    of ``threads`` (``MODELTRANSLATION_PANEL_STATS_THREADS`` by default), models are counted
+    concurrently by a pool of at most that many threads, each with its own connections.
+    """
+    if threads is None:
+        threads = mt_settings.PANEL_STATS_THREADS
+    models = list(models)
+    if threads > 1 and len(models) > 1 and all(
+            _shares_data_between_threads(router.db_for_read(model)) for model in models):
+        pool = ThreadPool(min(threads, len(models)))
+        try:
+            results = pool.map(_closing_connections(panel_model_stats), models)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [panel_model_stats(model) for model in models]
+    return dict(zip(models, results))
+
+
+def panel_stats_cache():
+    try:
+        from django.core.cache import caches
+    except ImportError:
+        # Django < 1.7
+        from django.core.cache import get_cache
+        return get_cache(mt_settings.PANEL_STATS_CACHE)
+    return caches[mt_settings.PANEL_STATS_CACHE]
+
+
+def precompute_panel_stats(models=None):
+    """
+    Computes panel statistics of ``models`` (all registered models by default) and stores them in
+    the ``MODELTRANSLATION_PANEL_STATS_CACHE`` cache, along with the time they were computed::
+
+        {'computed': datetime, 'models': {'app.model': {'de': {'translated': 10, ...}}}}
+    """
+    from modeltranslation.translator import translator
+    if models is None:
+        models = translator.get_registered_models(abstract=False)
+    models = [model for model in models
+              if translator.get_options_for_model(model).get_translation_fields()]
+    stats = {
+        'computed': timezone.now(),
+        'models': dict((model_label(model), model_stats)
+                       for model, model_stats in panel_stats(models).items()),
+    }
+    # Kept until the next run of the command
+    panel_stats_cache().set(PANEL_STATS_CACHE_KEY, stats, None)
+    return stats
+
+
+def cached_panel_stats():
+    """
+    Returns statistics stored by ``precompute_panel_stats``, or ``None`` if the cache isn't
+    enabled or filled.
+    """
+    if not mt_settings.PANEL_STATS_CACHE:
+        return None
+    return panel_stats_cache().get(PANEL_STATS_CACHE_KEY)
+
+
+# ######### Export
+
+EXPORT_COLUMNS = ('model', 'pk', 'field', 'language', 'status', 'last_modified',
+                  'default_last_modified')
+
+
+def _status_flags(values, field_name, lang, monitored):
+    """
+    Same as ``status_expression``, computed from ``values`` of a row.
+    """
+    value = values[build_localized_fieldname(field_name, lang)]
+    default_value = values[build_localized_fieldname(field_name, mt_settings.DEFAULT_LANGUAGE)]
+    flags = 0
+    if is_empty(value) and not is_empty(default_value):
+        flags |= STATUS_MISSING
+    if value == default_value or (is_empty(value) and is_empty(default_value)):
+        flags |= STATUS_EQUAL
+    if not monitored:
+        flags |= STATUS_UPDATED
+    else:
+        modified = values[last_modified_name(field_name, lang)]
+        default_modified = values[last_modified_name(field_name, mt_settings.DEFAULT_LANGUAGE)]
+        if None not in (modified, default_modified) and (
+                modified > default_modified + UPDATE_MARGIN):
+            flags |= STATUS_UPDATED
+    return flags
+
+
+def _iterate_chunks(queryset, chunk_size):
+    """
+    Iterates rows of a values ``queryset`` reading them by chunks of ``chunk_size``, sought by
+    primary key (so that late chunks are as fast to read as the first one).
+    """
+    queryset = queryset.order_by('pk')
+    chunk = queryset[:chunk_size]
+    while True:
+        rows = list(chunk)
+        for row in rows:
+            yield row
+        if len(rows) < chunk_size:
+            return
+        chunk = queryset.filter(pk__gt=rows[-1]['pk'])[:chunk_size]
+
+
+def translation_status_rows(queryset, fields, languages=None, chunk_size=1000):
+    """
+    Yields the translation status of every instance of ``queryset``, field of ``fields`` and
+    language of ``languages`` (non default languages by default) as a dict of
+    ``EXPORT_COLUMNS``. Only needed columns are read (statuses are computed in the database on
+    Django >= 1.8), ``chunk_size`` rows at a time.
+    """
+    model = queryset.model
+    default = mt_settings.DEFAULT_LANGUAGE
+    if languages is None:
+        languages = [lang for lang in mt_settings.AVAILABLE_LANGUAGES if lang != default]
+    model_fields = set(field.name for field in model._meta.fields)
+
+    def modified_name(field, lang):
+        name = last_modified_name(field, lang)
+        return name if name in model_fields else None
+
+    names = set(['pk'])
+    for field in fields:
+        for lang in list(languages) + [default]:
+            names.add(modified_name(field, lang))
+            if not CONDITIONAL_EXPRESSIONS:
+                names.add(build_localized_fieldname(field, lang))
+    names.discard(None)
+    if CONDITIONAL_EXPRESSIONS:
+        for lang in languages:
+            queryset = annotate_translation_status(queryset, fields, lang)
+            names.update(status_name(field, lang) for field in fields)
+
+    label = model_label(model)
+    for row in _iterate_chunks(queryset.values(*names), chunk_size):
+        for field in fields:
+            default_modified = row.get(modified_name(field, default))
+            for lang in languages:
+                modified = row.get(modified_name(field, lang))
+                if CONDITIONAL_EXPRESSIONS:
+                    flags = row[status_name(field, lang)]
+                else:
+                    flags = _status_flags(row, field, lang, modified_name(field, lang) is not None)
+                yield {
+                    'model': label, 'pk': row['pk'], 'field': field, 'language': lang,
+                    'status': STATUS_LABELS[flags], 'last_modified': modified,
+                    'default_last_modified': default_modified,
+                }
+
+
+class _Echo(object):
+    """
+    File-like object whose ``write`` returns what was written, for ``csv.writer``.
+    """
+    def write(self, value):
+        return value
+
+
+def export_rows(rows, format='csv'):
+    """
+    Yields ``rows`` (see ``translation_status_rows``) serialized as CSV (headed by
+    ``EXPORT_COLUMNS``) or JSON lines (``format='jsonl'``), a line at a time.
+    """
+    if format == 'jsonl':
+        encoder = DjangoJSONEncoder()
+        for row in rows:
+            yield encoder.encode(row) + '\n'
+        return
+    if format != 'csv':
+        raise ValueError("Unknown export format: '%s'" % format)
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([
+            force_str(value.isoformat() if hasattr(value, 'isoformat') else
+                      '' if value is None else value)
+            for value in (row[column] for column in EXPORT_COLUMNS)])
@@ -1,6 +1,9 @@
 from django import template
-from datetime import timedelta
 from django.utils.safestring import mark_for_escaping
+
+from modeltranslation.stats import STATUS_LABELS, UPDATE_MARGIN, is_empty, status_name
+from modeltranslation.utils import build_localized_fieldname
+
 register = template.Library()
 
 
@@ -31,12 +34,13 @@ def translation_status(model, language):
 
 @register.simple_tag(name="getattrl")
 def getattribute_lang(obj, field_name, lang_code):
-    return getattr(obj, '{0}_{1}'.format(field_name, lang_code), None) or ''
+    return getattr(obj, build_localized_fieldname(field_name, lang_code), None) or ''
 
 
 @register.simple_tag(name="getlastmodifiedl")
 def getlastmodified_lang(obj, field_name, lang_code):
-    last_modified = getattr(obj, '{0}_{1}_last_modified'.format(field_name, lang_code), None)
+    last_modified = getattr(
+        obj, '{0}_last_modified'.format(build_localized_fieldname(field_name, lang_code)), None)
     if last_modified is not None:
         last_modified = last_modified.strftime('%d-%m-%Y %H:%M:%S')
     return last_modified or 'Unknown'
@@ -57,23 +61,27 @@ def getattribute(obj, field_name):
 def is_uptodate(obj, field, lang, default_language):
     status = []
 
-    field_value_en = getattr(obj, '{0}_{1}'.format(field, default_language))
-    field_value_lang = getattr(obj, '{0}_{1}'.format(field, lang))
+    field_default = build_localized_fieldname(field, default_language)
+    field_lang = build_localized_fieldname(field, lang)
+    field_value_en = getattr(obj, field_default)
+    field_value_lang = getattr(obj, field_lang)
     # import ipdb; ipdb.set_trace()
     # Finally check if is None and the default is not
-    if not field_value_lang and field_value_en:
+    if is_empty(field_value_lang) and not is_empty(field_value_en):
         status.append('missing')
     # import ipdb; ipdb.set_trace()
     # Check if the content is equal to the default one
-    if (field_value_lang or '') == (field_value_en or ''):
+    if field_value_lang == field_value_en or (
+            is_empty(field_value_lang) and is_empty(field_value_en)):
         status.append('equal')
 
-    if hasattr(obj, '{0}_{1}_last_modified'.format(field, lang)):
-        last_modified_en = getattr(obj, '{0}_{1}_last_modified'.format(field, default_language))
-        last_modified_lang = getattr(obj, '{0}_{1}_last_modified'.format(field, lang))
+    if hasattr(obj, '{0}_last_modified'.format(field_lang)):
+        last_modified_en = getattr(obj, '{0}_last_modified'.format(field_default))
+        last_modified_lang = getattr(obj, '{0}_last_modified'.format(field_lang))
 
         # If this language was modified before the english one
-        if last_modified_lang - last_modified_en < timedelta(seconds=30):
+        if None in (last_modified_lang, last_modified_en) or (
+                last_modified_lang <= last_modified_en + UPDATE_MARGIN):
             status.append('not-updated')
         else:
             status.append('updated')
@@ -83,3 +91,15 @@ def is_uptodate(obj, field, lang, default_language):
 
     # Return all the status labels:
     return ' '.join(status)
+
+
+@register.simple_tag(name="translation_field_status")
+def translation_field_status(obj, field, lang, default_language):
+    """
+    Same as ``is_uptodate``, but reads the status annotated by ``annotate_translation_status`` if
+    it is available.
+    """
+    flags = getattr(obj, status_name(field, lang), None)
+    if flags is None:
+        return is_uptodate(obj, field, lang, default_language)
+    return STATUS_LABELS[flags]
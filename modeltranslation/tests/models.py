@@ -313,3 +313,17 @@ class RequiredModel(models.Model):
 
 class DecoratedModel(models.Model):
     title = models.CharField(ugettext_lazy('title'), max_length=255)
+
+
+# ######### Filled languages testing
+
+class FilledModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
+    text = models.TextField(blank=True, null=True)
+    visits = models.IntegerField(default=0)
+
+
+# ######### Coverage store testing
+
+class UntrackedModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
@@ -6,6 +6,7 @@ from django.conf import settings
 
 
 INSTALLED_APPS = tuple(settings.INSTALLED_APPS) + (
+    'modeltranslation.coverage',
     'modeltranslation.tests',
 )
 
@@ -13,9 +13,11 @@ from django.core.exceptions import ValidationError, ImproperlyConfigured
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.db import IntegrityError
 from django.db.models import Q, F, Count
 from django.test import TestCase, TransactionTestCase
+from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from django.utils import six
 from django.utils.translation import get_language, override, trans_real
@@ -39,6 +41,7 @@ except ImportError:
         return lambda x: x  # identity
 
 from modeltranslation import admin, settings as mt_settings, translator
+from modeltranslation.fields import TranslationFieldDescriptor
 from modeltranslation.forms import TranslationModelForm
 from modeltranslation.models import autodiscover
 from modeltranslation.tests.test_settings import TEST_SETTINGS
@@ -54,7 +57,7 @@ models = translation = None
 request = None
 
 # How many models are registered for tests.
-TEST_MODELS = 29 + (1 if MIGRATIONS else 0)
+TEST_MODELS = 31 + (1 if MIGRATIONS else 0)
 
 
 class reload_override_settings(override_settings):
@@ -321,6 +324,351 @@ class ModeltranslationTest(ModeltranslationTestBase):
         except:
             self.fail('Descriptor accessed on class should return itself.')
 
+    def test_get_language(self):
+        from modeltranslation.utils import get_language as mt_get_language, _LANGUAGE_CACHE
+        with override('en-us'):
+            self.assertEqual(mt_get_language(), 'en')
+            self.assertEqual(_LANGUAGE_CACHE['en-us'], 'en')
+        with override('fr'):
+            self.assertEqual(mt_get_language(), 'de')
+        with reload_override_settings(MODELTRANSLATION_DEFAULT_LANGUAGE='en'):
+            # Reloaded settings reset normalized languages
+            with override('fr'):
+                self.assertEqual(mt_get_language(), 'en')
+
+    def test_localized_fieldnames_table(self):
+        from modeltranslation.utils import _LOCALIZED_FIELDNAMES
+        # Registered fields are precomputed (and interned)
+        self.assertIs(build_localized_fieldname('title', 'de'),
+                      _LOCALIZED_FIELDNAMES['title', 'de'])
+        self.assertIs(build_localized_fieldname('title', 'de'),
+                      build_localized_fieldname('title', 'de'))
+        # Unknown pairs are formatted as usual
+        self.assertNotIn(('unknown', 'id'), _LOCALIZED_FIELDNAMES)
+        self.assertEqual(build_localized_fieldname('unknown', 'id'), 'unknown_ind')
+        self.assertEqual(build_localized_fieldname('unknown', 'en-us'), 'unknown_en_us')
+
+    def test_translation_meta(self):
+        meta = translator.translator.get_options_for_model(models.ForeignKeyModel).meta
+        self.assertEqual(set(meta.fields), set(['title', 'test', 'optional', 'hidden', 'non']))
+        self.assertEqual(meta.languages, ('de', 'en'))
+        self.assertEqual(meta.localized['title'], ('title_de', 'title_en'))
+        self.assertEqual(meta.localized_by_lang['test', 'en'], 'test_en')
+        self.assertEqual(meta.fk_attnames['test'], {'de': 'test_de_id', 'en': 'test_en_id'})
+        self.assertNotIn('title', meta.fk_attnames)
+        self.assertEqual(meta.defaults['title'], '')
+        self.assertEqual(meta.empty_values['title_de'], '')
+        self.assertIn('title_de', meta.tracked)
+        self.assertEqual(meta.fallback_names('title', 'en'), ('title_en',))
+        with default_fallback():
+            self.assertEqual(meta.fallback_names('title', 'en'), ('title_en', 'title_de'))
+        self.assertRaises(AttributeError, setattr, meta, 'fields', ())
+        # Descriptors read it from the translator unless it is given
+        descriptor = TranslationFieldDescriptor(models.ForeignKeyModel._meta.get_field('title'))
+        self.assertIs(descriptor.meta, meta)
+
+        # Proxy models share translation fields of their concrete model
+        meta = translator.translator.get_options_for_model(models.ProxyTestModel).meta
+        self.assertEqual(meta.localized['title'], ('title_de', 'title_en'))
+
+    def test_last_modified(self):
+        pk = models.TestModel.objects.create(title_en='en', title_de='de').pk
+        obj = models.TestModel.objects.get(pk=pk)
+        stamp_en, stamp_de = obj.title_en_last_modified, obj.title_de_last_modified
+        obj.title_en = 'changed'
+        # No queries besides the UPDATE - loaded values are remembered
+        with self.assertNumQueries(1):
+            obj.save()
+        self.assertGreater(obj.title_en_last_modified, stamp_en)
+        self.assertEqual(obj.title_de_last_modified, stamp_de)
+        stamp_en = obj.title_en_last_modified
+        with self.assertNumQueries(1):
+            obj.save()
+        self.assertEqual(obj.title_en_last_modified, stamp_en)
+
+        # Refreshed values replace the loaded ones
+        for fields in (None, ['title_en']):
+            obj = models.TestModel.objects.get(pk=pk)
+            models.TestModel.objects.filter(pk=pk).update(title_en='updated %s' % fields)
+            obj.refresh_from_db(fields=fields)
+            stamp_en = obj.title_en_last_modified
+            with self.assertNumQueries(1):
+                obj.save()
+            self.assertEqual(obj.title_en_last_modified, stamp_en)
+            self.assertEqual(models.TestModel.objects.get(pk=pk).title_en_last_modified, stamp_en)
+        # Fields are given by name
+        fk = models.ForeignKeyModel.objects.create(test_de_id=pk)
+        other_pk = models.TestModel.objects.create(title_de='other').pk
+        obj = models.ForeignKeyModel.objects.get(pk=fk.pk)
+        models.ForeignKeyModel.objects.filter(pk=fk.pk).update(test_de=other_pk)
+        obj.refresh_from_db(fields=['test_de'])
+        stamp_de = obj.test_de_last_modified
+        with self.assertNumQueries(1):
+            obj.save()
+        self.assertEqual(
+            models.ForeignKeyModel.objects.get(pk=fk.pk).test_de_last_modified, stamp_de)
+
+        # Values are remembered once saved
+        from django.db import DatabaseError, transaction
+        obj = models.TestModel.objects.get(pk=pk)
+        stamp_en = obj.title_en_last_modified
+        obj.title_en = 'unsaved'
+
+        def fail(*args, **kwargs):
+            raise DatabaseError
+        models.TestModel._do_update = fail
+        try:
+            with self.assertRaises(DatabaseError):
+                with transaction.atomic():
+                    obj.save()
+        finally:
+            del models.TestModel._do_update
+        obj.title_en_last_modified = stamp_en
+        obj.save()
+        self.assertGreater(obj.title_en_last_modified, stamp_en)
+
+        # Values that weren't loaded are fetched at once
+        obj = models.TestModel(pk=pk, title_en='changed', title_de='de')
+        with self.assertNumQueries(2):
+            obj.save()
+        with self.assertNumQueries(1):
+            obj.save()
+
+    def test_translation_stats(self):
+        from modeltranslation.stats import model_translation_stats, translation_stats
+        first = models.TestModel.objects.create(title_en='en', title_de='de')
+        models.TestModel.objects.create(title_en='en', title_de='de')
+        later = first.title_de_last_modified + datetime.timedelta(hours=1)
+        models.TestModel.objects.filter(pk=first.pk).update(
+            title_en_last_modified=later, text_en_last_modified=later)
+        queryset = models.TestModel.objects.all()
+        with self.assertNumQueries(1):
+            stats = translation_stats(queryset, ['title', 'text'])
+        self.assertEqual(stats['en'], {'translated': 1, 'to_translate': 1, 'total': 2})
+        self.assertEqual(stats['de'], {'translated': 0, 'to_translate': 2, 'total': 2})
+        self.assertEqual(
+            translation_stats(queryset, ['title', 'url'], ['en'])['en']['translated'], 0)
+        self.assertEqual(translation_stats(queryset, [], ['en'])['en']['translated'], 2)
+        self.assertEqual(translation_stats(queryset.none(), ['title'], ['en'])['en'],
+                         {'translated': 0, 'to_translate': 0, 'total': 0})
+        self.assertEqual(
+            admin.queryset_updated(queryset, ['title', 'text'], 'en').count(), 1)
+        self.assertEqual(
+            admin.queryset_not_updated(queryset, ['title', 'text'], 'en').count(), 1)
+        self.assertEqual(model_translation_stats(models.TestModel, ['de'])['de']['total'], 2)
+
+    def test_translation_status_annotation(self):
+        from modeltranslation.stats import (STATUS_LABELS, annotate_translation_status,
+                                            status_name, updated_status_q)
+        from modeltranslation.templatetags.modeltranslation_tags import is_uptodate
+        models.TestModel.objects.create(title_en='', title_de='de')
+        models.TestModel.objects.create(title_en='same', title_de='same')
+        updated = models.TestModel.objects.create(title_en='en', title_de='de')
+        later = updated.title_de_last_modified + datetime.timedelta(hours=1)
+        models.TestModel.objects.filter(pk=updated.pk).update(title_en_last_modified=later)
+
+        fields = ['title', 'text']
+        queryset = annotate_translation_status(models.TestModel.objects.all(), fields, 'en')
+        for obj in queryset:
+            for field in fields:
+                self.assertEqual(STATUS_LABELS[getattr(obj, status_name(field, 'en'))],
+                                 is_uptodate(obj, field, 'en', 'de'))
+        self.assertEqual(list(queryset.filter(updated_status_q(['title'], 'en'))), [updated])
+        self.assertEqual(queryset.exclude(updated_status_q(['title'], 'en')).count(), 2)
+        self.assertEqual(queryset.filter(updated_status_q(fields, 'en')).count(), 0)
+
+        # Zero is a translation, only NULL and empty strings are missing
+        for visits_en, visits_de, label in ((0, 5, 'not-updated'),
+                                            (None, 0, 'missing not-updated'),
+                                            (0, 0, 'equal not-updated')):
+            models.ManagerTestModel.objects.create(
+                title_en='en', title_de='de', visits_en=visits_en, visits_de=visits_de)
+            obj = annotate_translation_status(
+                models.ManagerTestModel.objects.order_by('-pk'), ['visits'], 'en')[0]
+            self.assertEqual(STATUS_LABELS[getattr(obj, status_name('visits', 'en'))], label)
+            self.assertEqual(is_uptodate(obj, 'visits', 'en', 'de'), label)
+
+    def test_coverage_store(self):
+        from modeltranslation.coverage.models import TranslationCoverage
+        from modeltranslation.stats import (coverage_stats, model_translation_stats,
+                                            tracked_coverage)
+        model = models.TestModel
+        models.TestModel.objects.create(title_en='en', title_de='de')
+        with reload_override_settings(MODELTRANSLATION_COVERAGE_STORE=True):
+            call_command('rebuild_translation_coverage', verbosity=0)
+            self.assertEqual(
+                TranslationCoverage.objects.filter(model='tests.testmodel').count(), 2)
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+
+            obj = models.TestModel.objects.create(title_en='en', title_de='de')
+            self.assertEqual(coverage_stats(model)['en']['total'], 2)
+            # Translated in English once all English fields were modified after German ones
+            obj = models.TestModel.objects.get(pk=obj.pk)
+            later = obj.title_de_last_modified + datetime.timedelta(hours=1)
+            for field in ('title', 'text', 'url', 'email'):
+                setattr(obj, '%s_en_last_modified' % field, later)
+            # Nothing is computed on load
+            self.assertNotIn('_mt_coverage', obj.__dict__)
+            # The UPDATE and an increment of the English row
+            with self.assertNumQueries(2):
+                obj.save()
+            stats = coverage_stats(model)
+            self.assertEqual(stats['en'], {'translated': 1, 'to_translate': 1, 'total': 2})
+            self.assertEqual(stats, model_translation_stats(model))
+            # Saved values are remembered
+            with self.assertNumQueries(1):
+                obj.save()
+            self.assertEqual(coverage_stats(model), stats)
+            # Instances that weren't loaded are read with one query
+            instance = models.TestModel(pk=obj.pk, title_en='en', title_de='de')
+            with self.assertNumQueries(4):
+                instance.save()
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+            # Raw saves (fixtures) leave the store alone
+            obj = models.TestModel.objects.get(pk=obj.pk)
+            for field in ('title', 'text', 'url', 'email'):
+                setattr(obj, '%s_en_last_modified' % field, later)
+            with self.assertNumQueries(1):
+                obj.save_base(raw=True)
+            self.assertEqual(coverage_stats(model)['en']['translated'], 0)
+            call_command('rebuild_translation_coverage', verbosity=0)
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+
+            models.TestModel.objects.get(pk=obj.pk).delete()
+            self.assertEqual(coverage_stats(model)['en'],
+                             {'translated': 0, 'to_translate': 1, 'total': 1})
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+            # Queryset updates are tracked explicitly
+            with tracked_coverage(model, [obj.pk for obj in model.objects.all()]):
+                model.objects.update(
+                    title_en_last_modified=later, text_en_last_modified=later,
+                    url_en_last_modified=later, email_en_last_modified=later)
+            self.assertEqual(coverage_stats(model)['en']['translated'], 1)
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+            # Missing rows are computed on demand
+            TranslationCoverage.objects.all().delete()
+            self.assertEqual(coverage_stats(model, ['de'])['de']['total'], 1)
+
+            # Models without monitored fields are tracked per instance as well
+            model = models.UntrackedModel
+            obj = model.objects.create(title_de='Titel')
+            self.assertEqual(coverage_stats(model)['en']['translated'], 1)
+            # The INSERT and increments of the rows
+            with self.assertNumQueries(3):
+                model.objects.create(title_de='Titel')
+            obj = model.objects.get(pk=obj.pk)
+            with self.assertNumQueries(1):
+                obj.save()
+            with self.assertNumQueries(3):
+                obj.delete()
+            self.assertEqual(coverage_stats(model), model_translation_stats(model))
+
+    def test_precomputed_panel_stats(self):
+        from modeltranslation.stats import cached_panel_stats, model_translation_stats
+        models.TestModel.objects.create(title_en='en', title_de='de')
+        self.assertIsNone(cached_panel_stats())
+        with reload_override_settings(MODELTRANSLATION_PANEL_STATS_CACHE='default'):
+            self.assertIsNone(cached_panel_stats())
+            call_command('precompute_translation_stats', verbosity=0)
+            stats = cached_panel_stats()
+            self.assertIsNotNone(stats['computed'])
+            self.assertEqual(stats['models']['tests.testmodel'],
+                             model_translation_stats(models.TestModel))
+            # Abstract models and models without translation fields aren't counted
+            self.assertNotIn('tests.abstractmodela', stats['models'])
+        self.assertRaises(CommandError, call_command, 'precompute_translation_stats', verbosity=0)
+
+    def test_panel_stats_threads(self):
+        from modeltranslation.stats import model_translation_stats, panel_stats
+        models.TestModel.objects.create(title_en='en', title_de='de')
+        panel_models = [models.TestModel, models.FallbackModel, models.FileFieldsModel]
+        serial = panel_stats(panel_models, threads=0)
+        self.assertEqual(serial[models.TestModel], model_translation_stats(models.TestModel))
+        # Inside the test transaction other threads wouldn't see the data, so models are
+        # counted serially
+        self.assertEqual(panel_stats(panel_models, threads=4), serial)
+
+    def test_translation_status_export(self):
+        import json
+        from modeltranslation.stats import export_rows, translation_status_rows
+        from modeltranslation.templatetags.modeltranslation_tags import is_uptodate
+        objs = [models.TestModel.objects.create(title_en='en %d' % i, title_de='de')
+                for i in range(3)]
+        objs.append(models.TestModel.objects.create(title_de='de'))
+        queryset = models.TestModel.objects.all()
+        # Read in chunks of two instances (the last one is empty)
+        with self.assertNumQueries(3):
+            rows = list(translation_status_rows(queryset, ['title', 'text'], chunk_size=2))
+        self.assertEqual(len(rows), 8)
+        self.assertEqual([(row['pk'], row['field']) for row in rows[:3]],
+                         [(objs[0].pk, 'title'), (objs[0].pk, 'text'), (objs[1].pk, 'title')])
+        for row in rows:
+            obj = models.TestModel.objects.get(pk=row['pk'])
+            self.assertEqual(row['status'], is_uptodate(obj, row['field'], 'en', 'de'))
+            self.assertEqual(row['last_modified'],
+                             getattr(obj, '%s_en_last_modified' % row['field']))
+        self.assertEqual(rows[-2]['status'], 'missing not-updated')
+
+        lines = list(export_rows(rows[:2]))
+        self.assertEqual(lines[0].strip(),
+                         'model,pk,field,language,status,last_modified,default_last_modified')
+        self.assertTrue(
+            lines[1].startswith('tests.testmodel,%d,title,en,not-updated,' % objs[0].pk))
+        line = json.loads(next(export_rows(rows, 'jsonl')))
+        self.assertEqual((line['pk'], line['status']), (objs[0].pk, 'not-updated'))
+
+        out = six.StringIO()
+        call_command('export_translations', 'tests.TestModel', format='jsonl', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 16)
+        self.assertEqual(json.loads(lines[0])['model'], 'tests.testmodel')
+        self.assertRaises(CommandError, call_command, 'export_translations', 'tests.unknown')
+
+    def test_track_filled(self):
+        from modeltranslation.fields import update_filled_languages
+        opts = models.FilledModel._meta
+        self.assertTrue(opts.get_field('translations_filled_en').db_index)
+        self.assertFalse(hasattr(models.TestModel, 'translations_filled_en'))
+
+        obj = models.FilledModel.objects.create(title_de='Titel', title_en='Title', text_de='')
+        self.assertEqual((obj.translations_filled_de, obj.translations_filled_en), (False, False))
+        obj.text_en = 'Text'
+        obj.save()
+        self.assertTrue(models.FilledModel.objects.get(pk=obj.pk).translations_filled_en)
+        # Partial saves write the columns of edited languages
+        obj.title_en = ''
+        obj.save(update_fields=['title_en'])
+        self.assertFalse(models.FilledModel.objects.get(pk=obj.pk).translations_filled_en)
+        obj.title_en = 'Title'
+        obj.save(update_fields=['title_en'])
+        self.assertTrue(models.FilledModel.objects.get(pk=obj.pk).translations_filled_en)
+        obj.title_en = ''
+        obj.save(False, False, None, ['title_en'])
+        self.assertFalse(models.FilledModel.objects.get(pk=obj.pk).translations_filled_en)
+        obj.title_en = 'Title'
+        obj.save()
+        # Zero is a value
+        models.FilledModel.objects.create(title_de='Titel', text_de='Text', visits_de=0)
+
+        self.assertEqual([o.title_de for o in models.FilledModel.objects.filled('de')], ['Titel'])
+        self.assertEqual(list(models.FilledModel.objects.filled('en')), [obj])
+        with override('en'):
+            self.assertEqual(models.FilledModel.objects.filled().count(), 1)
+            self.assertEqual(models.FilledModel.objects.unfilled().count(), 1)
+        self.assertIn('translations_filled_en', str(
+            models.FilledModel.objects.filled('en').query))
+        # Models without the columns check every field
+        models.TestModel.objects.create(title_de='Titel', text_de='Text', url_de='http://a.de',
+                                        email_de='a@b.de')
+        self.assertEqual(models.TestModel.objects.filled('de').count(), 1)
+        self.assertEqual(models.TestModel.objects.unfilled('en').count(), 1)
+
+        # Queryset updates are followed by a recomputation
+        models.FilledModel.objects.filter(pk=obj.pk).update(title_en='')
+        self.assertEqual(models.FilledModel.objects.filled('en').count(), 1)
+        update_filled_languages(models.FilledModel.objects.all())
+        self.assertEqual(models.FilledModel.objects.filled('en').count(), 0)
+
     def test_fields_hashes(self):
         opts = models.TestModel._meta
         orig = opts.get_field('title')
@@ -579,6 +927,25 @@ class FallbackTests(ModeltranslationTestBase):
             self.assertEqual(('en',), resolution_order('en', config))
             self.assertEqual(('de',), resolution_order('de', config))
 
+    def test_resolution_order_cache(self):
+        from modeltranslation.utils import resolution_order
+        resolution_order.cache_clear()
+        with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
+            self.assertEqual(('en', 'de'), resolution_order('en'))
+            self.assertEqual(('en', 'de'), resolution_order('en'))
+            self.assertEqual((1, 1), resolution_order.cache_info()[:2])
+            config = {'default': ()}
+            self.assertEqual(('en',), resolution_order('en', config))
+            self.assertEqual((1, 2), resolution_order.cache_info()[:2])
+            # Disabled fallbacks bypass the cache
+            with fallbacks(False):
+                self.assertEqual(('de',), resolution_order('de'))
+            self.assertEqual((1, 2), resolution_order.cache_info()[:2])
+        # Reloaded settings invalidate cached orders
+        self.assertEqual(('en',), resolution_order('en'))
+        info = resolution_order.cache_info()
+        self.assertEqual((1, 3, 1), (info.hits, info.misses, info.currsize))
+
     def test_fallback_languages(self):
         with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
             title_de = 'title de'
@@ -655,6 +1022,18 @@ class FallbackTests(ModeltranslationTestBase):
             with override('de'):
                 self.assertEqual(m.title, 'value')
 
+    def test_fallback_chain(self):
+        descriptor = models.ForeignKeyModel.title
+        self.assertEqual(descriptor.fallback_chain('de'), (('title_de', True),))
+        with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
+            self.assertEqual(descriptor.fallback_chain('de'),
+                             (('title_de', True), ('title_en', True)))
+            with fallbacks(False):
+                self.assertEqual(descriptor.fallback_chain('de'), (('title_de', True),))
+            # Relations are read through their descriptors
+            self.assertEqual(models.ForeignKeyModel.test.fallback_chain('en'),
+                             (('test_en', False), ('test_de', False)))
+
 
 class FileFieldsTest(ModeltranslationTestBase):
 
@@ -1980,6 +2359,189 @@ class TranslationAdminTest(ModeltranslationTestBase):
         self.test_obj.delete()
         super(TranslationAdminTest, self).tearDown()
 
+    def test_process_translations_batch(self):
+        import json
+        from django.contrib.auth.models import User
+        from django.core.exceptions import PermissionDenied
+        from modeltranslation.templatetags.modeltranslation_tags import is_uptodate
+        ma = admin.TranslationAdmin(models.TestModel, self.site)
+        other = models.TestModel.objects.create(title_de='Titel', title_en='Title')
+        stamp = models.TestModel.objects.get(pk=other.pk).title_en_last_modified
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+
+        def post(edits, user=admin_user, **data):
+            request = RequestFactory().post(
+                '/', json.dumps(dict({'lang': 'en', 'edits': edits}, **data)),
+                content_type='application/json')
+            request.user = user
+            return ma.process_translations_batch(request)
+
+        edits = [
+            {'instance': self.test_obj.pk, 'name': 'title_en', 'value': 'first'},
+            {'instance': other.pk, 'name': 'title_en', 'value': 'second'},
+            {'instance': str(other.pk), 'name': 'text_en', 'value': 'text'},
+        ]
+        # An UPDATE per field (inside a savepoint of the test transaction) and the refetch
+        num_queries = 5 if django.VERSION >= (1, 8) else 6
+        with self.assertNumQueries(num_queries):
+            response = post(edits)
+        results = json.loads(response.content.decode('utf-8'))['results']
+        self.assertEqual([(r['instance_id'], r['field_name'], r['field_value']) for r in results],
+                         [(self.test_obj.pk, 'title_en', 'first'), (other.pk, 'title_en', 'second'),
+                          (other.pk, 'text_en', 'text')])
+        self.assertEqual(results[0]['status'],
+                         is_uptodate(models.TestModel.objects.get(pk=self.test_obj.pk),
+                                     'title', 'en', 'de'))
+        other = models.TestModel.objects.get(pk=other.pk)
+        self.assertEqual((other.title_en, other.title_de, other.text_en),
+                         ('second', 'Titel', 'text'))
+        self.assertGreater(other.title_en_last_modified, stamp)
+        self.assertEqual(other.title_en_last_modified, other.text_en_last_modified)
+
+        # Unchanged values keep their stamp
+        stamp = other.title_en_last_modified
+        obj_stamp = models.TestModel.objects.get(pk=self.test_obj.pk).title_en_last_modified
+        post([{'instance': other.pk, 'name': 'title_en', 'value': 'second'}])
+        self.assertEqual(models.TestModel.objects.get(pk=other.pk).title_en_last_modified, stamp)
+        post([{'instance': other.pk, 'name': 'title_en', 'value': 'second'},
+              {'instance': self.test_obj.pk, 'name': 'title_en', 'value': 'changed'}])
+        self.assertEqual(models.TestModel.objects.get(pk=other.pk).title_en_last_modified, stamp)
+        self.assertGreater(
+            models.TestModel.objects.get(pk=self.test_obj.pk).title_en_last_modified, obj_stamp)
+
+        # Only translation fields can be edited
+        response = post([{'instance': other.pk, 'name': 'title', 'value': 'x'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(models.TestModel.objects.get(pk=other.pk).title_en, 'second')
+
+        # Malformed payloads are rejected before saving anything
+        valid = {'instance': other.pk, 'name': 'title_en', 'value': 'x'}
+        for edits, data in (([valid], {'lang': 'xx'}), (None, {}),
+                            ([valid, {'instance': other.pk, 'name': 'title_en'}], {}),
+                            ([valid, {'instance': 'x', 'name': 'title_en', 'value': 'y'}], {})):
+            self.assertEqual(post(edits, **data).status_code, 400)
+        request = RequestFactory().post('/', '{"lang": "en"}', content_type='application/json')
+        request.user = admin_user
+        self.assertEqual(ma.process_translations_batch(request).status_code, 400)
+        self.assertEqual(models.TestModel.objects.get(pk=other.pk).title_en, 'second')
+
+        # Editors need the change permission
+        user = User.objects.create_user('editor', 'editor@example.com', 'editor')
+        self.assertRaises(PermissionDenied, post, [valid], user=user)
+
+    def test_process_translations(self):
+        import json
+        ma = admin.TranslationAdmin(models.TestModel, self.site)
+        obj = models.TestModel.objects.create(title_de='Titel', title_en='Title')
+
+        def put(view, **data):
+            request = RequestFactory().put(
+                '/', json.dumps(dict(data, lang='en', instance=obj.pk)),
+                content_type='application/json')
+            return json.loads(view(request).content.decode('utf-8'))
+
+        # The UPDATE and the refetch of the status
+        with self.assertNumQueries(2):
+            result = put(ma.process_translations, name='title_en', value='Titel')
+        self.assertEqual((result['instance_id'], result['field_value']), (obj.pk, 'Titel'))
+        # Modified within UPDATE_MARGIN after the German one
+        self.assertEqual(result['status'], 'equal not-updated')
+        saved = models.TestModel.objects.get(pk=obj.pk)
+        self.assertEqual((saved.title_en, saved.title_de), ('Titel', 'Titel'))
+
+        models.TestModel.objects.filter(pk=obj.pk).update(
+            title_de_last_modified=F('title_de_last_modified') - datetime.timedelta(hours=1))
+        with self.assertNumQueries(2):
+            result = put(ma.update_translations, name='title_en', status='updated')
+        self.assertEqual(result['status'], 'equal updated')
+        with self.assertNumQueries(2):
+            result = put(ma.update_translations, name='title_en', status='not-updated')
+        self.assertEqual(result['status'], 'equal not-updated')
+        saved = models.TestModel.objects.get(pk=obj.pk)
+        self.assertEqual(saved.title_en_last_modified, saved.title_de_last_modified)
+        self.assertEqual(put(ma.process_translations, name='title', value='x')['error'],
+                         'Unknown translation field: title')
+
+    def test_translations_keyset_pagination(self):
+        from django.core.urlresolvers import ResolverMatch
+
+        class TestModelAdmin(admin.TranslationAdmin):
+            list_per_page = 2
+            translations_pagination = 'keyset'
+
+        class StatusFilter(admin.TranslationStatusFilter):
+            fields = ['title']
+
+        ma = TestModelAdmin(models.TestModel, self.site)
+        pks = [self.test_obj.pk] + [
+            models.TestModel.objects.create(title_de='Titel %d' % i).pk for i in range(3)]
+
+        def changelist(**params):
+            request = RequestFactory().get('/', dict(params, lang='en'))
+            request.resolver_match = ResolverMatch(
+                None, (), {}, url_name='tests_testmodel_translations', namespaces=['admin'])
+            return admin.TranslationsChangeList(
+                request, models.TestModel, ['title'], ['title'],
+                (admin.LanguageFilter, StatusFilter, admin.KeysetFilter),
+                None, (), False, ma.list_per_page, ma.list_max_show_all, ['title_en'], ma)
+
+        cl = changelist()
+        self.assertEqual([obj.pk for obj in cl.result_list], pks[:2])
+        self.assertEqual(cl.result_count, 4)
+        self.assertEqual(cl.next_page_url(), '?after=%d&lang=en' % pks[1])
+        cl = changelist(after=str(pks[1]))
+        self.assertEqual([obj.pk for obj in cl.result_list], pks[2:])
+        self.assertIsNone(cl.next_page_url())
+        # Other links start from the first page again
+        self.assertEqual(cl.get_query_string({'q': 'x'}), '?lang=en&q=x')
+        # Keyset pages aren't sortable
+        cl = changelist(o='-1')
+        self.assertEqual([obj.pk for obj in cl.result_list], pks[:2])
+        self.assertEqual(cl.get_ordering_field_columns(), {})
+        self.assertEqual(cl.next_page_url(), '?after=%d&lang=en' % pks[1])
+        self.assertEqual(cl.get_query_string({'o': '1'}), '?lang=en')
+        self.assertRaises(admin.IncorrectLookupParameters, changelist, after='x')
+
+        ma.translations_estimated_counts = True
+        ma.translations_pagination = 'offset'
+        cl = changelist(p='1')
+        self.assertEqual(cl.paginator.count, 4)
+        self.assertEqual(len(cl.result_list), 2)
+
+    def test_translations_changelist_class(self):
+        from django.contrib.admin.views.main import ChangeList
+
+        class CustomChangeList(ChangeList):
+            pass
+
+        class TestModelAdmin(admin.TranslationAdmin):
+            def get_changelist(self, request, **kwargs):
+                return CustomChangeList
+
+        ma = admin.TranslationAdmin(models.TestModel, self.site)
+        self.assertIs(ma.get_translations_changelist(request), admin.TranslationsChangeList)
+        ma = TestModelAdmin(models.TestModel, self.site)
+        cl_class = ma.get_translations_changelist(request)
+        self.assertTrue(issubclass(cl_class, admin.TranslationsChangeList))
+        self.assertTrue(issubclass(cl_class, CustomChangeList))
+        self.assertIs(ma.get_translations_changelist(request), cl_class)
+
+    def test_export_translations(self):
+        from django.contrib.auth.models import User
+        ma = admin.TranslationAdmin(models.TestModel, self.site)
+        request = RequestFactory().get('/', {'lang': 'en'})
+        request.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        response = ma.export_translations(request)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'model,pk,field,language,status,last_modified,'
+                                   'default_last_modified')
+        # A line per translation field
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(set(tuple(line.split(',')[:4]) for line in lines[1:]),
+                         set(('tests.testmodel', str(self.test_obj.pk), field, 'en')
+                             for field in ('title', 'text', 'url', 'email')))
+
     def test_default_fields(self):
         class TestModelAdmin(admin.TranslationAdmin):
             pass
@@ -2518,6 +3080,25 @@ class TestManager(ModeltranslationTestBase):
         self.assertEqual(titles_for_en, ('most', 'more_en', 'more_de', 'least'))
         self.assertEqual(titles_for_de, ('most', 'more_de', 'more_en', 'least'))
 
+    def test_order_by_meta_cache(self):
+        from modeltranslation.manager import MultilingualQuerySet, _ORDERING_CACHE
+        manager = models.ManagerTestModel.objects
+        self.assertEqual(manager.all().query.order_by, ['-visits_en'])
+        self.assertEqual(_ORDERING_CACHE[models.ManagerTestModel, 'en'], ('-visits_en',))
+        with override('de'):
+            self.assertEqual(manager.all().query.order_by, ['-visits_de'])
+        self.assertEqual(manager.order_by('title').query.order_by, ['title_en'])
+
+        # Querysets straight from a manager have nothing to rewrite
+        walked = []
+        rewrite_where = MultilingualQuerySet._rewrite_where
+        MultilingualQuerySet._rewrite_where = lambda self, q: walked.append(q)
+        try:
+            manager.all()
+        finally:
+            MultilingualQuerySet._rewrite_where = rewrite_where
+        self.assertEqual(walked, [])
+
     def assert_fallback(self, method, expected1, *args, **kwargs):
         transform = kwargs.pop('transform', lambda x: x)
         expected2 = kwargs.pop('expected_de', expected1)
@@ -2550,6 +3131,139 @@ class TestManager(ModeltranslationTestBase):
         self.assert_fallback(manager.values, 'fallback', 'title', transform=lambda x: x['title'])
         self.assert_fallback(manager.values_list, ('fallback', 'fallback'), 'title', 'text')
 
+    def test_values_fallback_resolver(self):
+        manager = models.FallbackModel2.objects
+        manager.create(title_en='no title', title_de='Titel', email_de='de@example.com')
+        with default_fallback():
+            row = manager.values('title', 'text', 'email')[0]
+            self.assertEqual(row['title'], 'Titel')
+            self.assertEqual(six.text_type(row['text']), 'Sorry, translation is not available.')
+            self.assertEqual(row['email'], 'de@example.com')
+            with override('de'):
+                self.assertEqual(list(manager.values_list('title', 'title_en')),
+                                 [('Titel', 'no title')])
+            # Resolved values keep their place next to extra selects and annotations
+            qs = manager.extra(select={'one': '1'}).annotate(n=Count('id'))
+            self.assertEqual(list(qs.values('title', 'one', 'n')),
+                             [{'title': 'Titel', 'one': 1, 'n': 1}])
+            self.assertEqual(list(qs.values_list('n', 'title')), [(1, 'Titel')])
+
+    def test_sql_fallbacks(self):
+        manager = models.FallbackModel2.objects
+        manager.create(title_en='no title', title_de='Titel', email_de='de@example.com')
+        manager.create(title_en='Title', title_de='', text_en='Text')
+        with default_fallback():
+            qs = manager.sql_fallbacks().order_by('pk')
+            self.assertEqual(
+                [(row[0], row[1], six.text_type(row[2])) for row in
+                 qs.values_list('title', 'email', 'text')],
+                [('Titel', 'de@example.com', 'Sorry, translation is not available.'),
+                 ('Title', None, 'Text')])
+            self.assertEqual(list(qs.values_list('title', flat=True)), ['Titel', 'Title'])
+            with override('de'):
+                self.assertEqual(list(qs.values('title', 'title_en')),
+                                 list(qs.sql_fallbacks(False).values('title', 'title_en')))
+            # A single resolved column is fetched, model instances are not affected
+            self.assertTrue(
+                str(qs.values('title').query).startswith('SELECT COALESCE(NULLIF('))
+            self.assertEqual([m.title for m in qs], ['Titel', 'Title'])
+            self.assertEqual(list(qs.sql_fallbacks(False).values_list('title', flat=True)),
+                             ['Titel', 'Title'])
+
+    def test_lean(self):
+        from modeltranslation.manager import MultilingualQuerySet
+        pk = models.TestModel.objects.create(title_de='Titel', title_en='Title').pk
+        deferred = set(['title_en', 'text_en', 'url_en', 'email_en', 'title_en_last_modified',
+                        'text_en_last_modified', 'url_en_last_modified',
+                        'email_en_last_modified'])
+        with override('de'):
+            obj = models.TestModel.objects.lean().get(pk=pk)
+            self.assertEqual(obj.get_deferred_fields(), deferred)
+            self.assertEqual(obj.title, 'Titel')
+            # Other languages are loaded on access
+            with self.assertNumQueries(1):
+                self.assertEqual(obj.title_en, 'Title')
+            obj = next(models.TestModel.objects.lean().iterator())
+            self.assertEqual(obj.get_deferred_fields(), deferred)
+            # Only loaded fields are taken out of only()
+            obj = models.TestModel.objects.lean().only('title').get(pk=pk)
+            self.assertEqual(obj.get_deferred_fields() & set(['title_de', 'title_en']),
+                             set(['title_en']))
+            # The language is the one active on evaluation
+            queryset = models.TestModel.objects.lean()
+        with override('en'):
+            self.assertIn('title_de', queryset.get(pk=pk).get_deferred_fields())
+            with default_fallback():
+                # German is the fallback language
+                self.assertEqual(queryset.get(pk=pk).get_deferred_fields(), set())
+        self.assertEqual(models.TestModel.objects.get(pk=pk).get_deferred_fields(), set())
+        # An evaluated lean queryset is reused in another language
+        with override('de'):
+            queryset = models.TestModel.objects.lean()
+            self.assertEqual(queryset[0].get_deferred_fields(), deferred)
+            list(queryset)
+        with override('en'):
+            obj = queryset.filter(pk=pk)[0]
+            self.assertIn('title_de', obj.get_deferred_fields())
+            self.assertNotIn('title_en', obj.get_deferred_fields())
+            self.assertEqual(queryset[0].get_deferred_fields(), deferred)
+        with override('de'):
+            self.assertEqual(
+                list(models.TestModel.objects.lean().values_list('title', flat=True)), ['Titel'])
+        with reload_override_settings(MODELTRANSLATION_LEAN_QUERYSETS=True):
+            self.assertTrue(models.TestModel.objects.get(pk=pk).get_deferred_fields())
+            self.assertFalse(
+                models.TestModel.objects.lean(False).get(pk=pk).get_deferred_fields())
+            # Admin forms need every language
+            from django.core.urlresolvers import ResolverMatch
+            request = RequestFactory().get('/')
+            request.resolver_match = ResolverMatch(
+                None, (), {}, url_name='tests_testmodel_change', namespaces=['admin'])
+            ma = admin.TranslationAdmin(models.TestModel, AdminSite())
+            self.assertFalse(ma.get_queryset(request).get(pk=pk).get_deferred_fields())
+            # Nor do internal reads of other languages
+            with override('de'):
+                with self.assertNumQueries(1):
+                    ma.get_translation_statuses([(pk, 'title_en')], 'en')
+                with self.assertNumQueries(2):
+                    models.TestModel(pk=pk, title_de='Titel', title_en='Title').save()
+        # Foreign keys joined with select_related are loaded
+        fk = models.ForeignKeyModel.objects.create(test_de_id=pk, test_en_id=pk)
+        with override('de'):
+            obj = models.ForeignKeyModel.objects.lean().select_related('test_en').get(pk=fk.pk)
+            self.assertNotIn('test_en_id', obj.get_deferred_fields())
+            self.assertIn('title_en', obj.get_deferred_fields())
+            with self.assertNumQueries(0):
+                self.assertEqual(obj.test_en.pk, pk)
+        with override('en'):
+            with default_fallback():
+                obj = models.ForeignKeyModel.objects.lean().related_fallbacks().select_related(
+                    'test').get(pk=fk.pk)
+                self.assertFalse(set(['test_de_id', 'test_en_id']) & obj.get_deferred_fields())
+        self.assertTrue(isinstance(models.TestModel.objects.lean(), MultilingualQuerySet))
+
+    def test_sql_fallbacks_filter_order(self):
+        manager = models.ManagerTestModel.objects
+        manager.create(title_en='b', title_de='', visits_en=1)
+        manager.create(title_en='', title_de='a', visits_en=2)
+        manager.create(title_en='c', title_de='d', visits_en=3)
+        with default_fallback():
+            qs = manager.sql_fallbacks()
+            # Rows without translation are sorted and filtered by the fallback value
+            self.assertEqual([m.title for m in qs.order_by('title')], ['a', 'b', 'c'])
+            self.assertEqual([m.title for m in qs.order_by('-title')], ['c', 'b', 'a'])
+            self.assertEqual([m.title for m in qs.filter(title__in=['a', 'c']).order_by('title')],
+                             ['a', 'c'])
+            self.assertEqual([m.title for m in qs.filter(Q(title='a') | Q(title='b'))],
+                             ['a', 'b'])
+            self.assertEqual(qs.exclude(title='a').count(), 2)
+            # Other keys are still rewritten
+            self.assertEqual(list(qs.filter(title='c', visits=3).values_list('visits', flat=True)),
+                             [3])
+            # Without the mode, the current language column is used
+            self.assertEqual([m.title for m in manager.order_by('title')], ['a', 'b', 'c'])
+            self.assertEqual(manager.filter(title='a').count(), 0)
+
     def test_values(self):
         manager = models.ManagerTestModel.objects
         id1 = manager.create(title_en='en', title_de='de').pk
@@ -2674,8 +3388,19 @@ class TestManager(ModeltranslationTestBase):
         deserialized = pickle.loads(serialized)
         self.assertIsInstance(deserialized, MultilingualQuerySet)
         self.assertIsInstance(deserialized, models.CustomQuerySet)
+        self.assertIs(deserialized.__class__, qs.__class__)
         self.assertListEqual(list(qs), list(deserialized))
 
+    def test_multilingual_class_cache(self):
+        from modeltranslation.manager import multilingual_queryset_factory
+        qs_class = models.CustomManager2TestModel.objects.all().__class__
+        self.assertIs(models.CustomManager2TestModel.objects.get_queryset().__class__, qs_class)
+        self.assertIs(multilingual_queryset_factory(models.CustomQuerySet, False), qs_class)
+        self.assertIs(multilingual_queryset_factory(qs_class, False), qs_class)
+        # Managers of the same class share their multilingual class
+        self.assertIs(models.CustomManagerTestModel.objects.__class__,
+                      models.CustomManagerTestModel.another_mgr_name.__class__)
+
     def test_non_objects_manager(self):
         """Test if managers other than ``objects`` are patched too"""
         from modeltranslation.manager import MultilingualManager
@@ -2909,6 +3634,64 @@ class TestManager(ModeltranslationTestBase):
         self.assertIn('text_en', dir(item1.__class__))
         self.assertIn('text_de', dir(item1.__class__))
 
+    def test_related_fallbacks(self):
+        from modeltranslation.manager import fallback_lookup_keys
+        test1 = models.TestModel.objects.create(title_de='eins')
+        test2 = models.TestModel.objects.create(title_de='zwei', title_en='two')
+        models.ForeignKeyModel.objects.create(title='a', test_de=test1)
+        models.ForeignKeyModel.objects.create(title='b', test_de=test1, test_en=test2)
+        with default_fallback():
+            self.assertEqual(fallback_lookup_keys(models.ForeignKeyModel, 'test__test_fks'),
+                             ['test_en__test_fks', 'test_de__test_fks'])
+            qs = models.ForeignKeyModel.objects.select_related('test').order_by('pk')
+            # The first row falls back to a related object which wasn't joined
+            with self.assertNumQueries(2):
+                self.assertEqual([item.test for item in qs], [test1, test2])
+            qs = qs.related_fallbacks().select_related('test')
+            self.assertEqual(set(qs.query.select_related), set(['test_en', 'test_de']))
+            with self.assertNumQueries(1):
+                self.assertEqual([item.test for item in qs], [test1, test2])
+                self.assertEqual([item.test_id for item in qs], [test1.pk, test2.pk])
+
+            # Reverse one-to-one caches are filled for the language the object was joined in
+            o2o = models.OneToOneFieldModel.objects.create(title='o2o', test_de=test1)
+            item = models.OneToOneFieldModel.objects.related_fallbacks().select_related(
+                'test').get(pk=o2o.pk)
+            with self.assertNumQueries(0):
+                self.assertEqual(item.test, test1)
+                with override('de'):
+                    self.assertEqual(item.test.test_o2o, item)
+
+    def test_related_fallbacks_prefetch(self):
+        test1 = models.TestModel.objects.create(title_de='eins')
+        test2 = models.TestModel.objects.create(title_de='zwei')
+        fk1 = models.ForeignKeyModel.objects.create(title='a', test_de=test1, untrans=test2)
+        fk2 = models.ForeignKeyModel.objects.create(title='b', test_de=test1, test_en=test2)
+        fk3 = models.ForeignKeyModel.objects.create(title='c', test_en=test1)
+        qs = models.TestModel.objects.order_by('pk')
+        with default_fallback():
+            # Only relations in the active language are prefetched by default
+            tests = list(qs.prefetch_related('test_fks'))
+            with self.assertNumQueries(0):
+                self.assertEqual([set(t.test_fks.all()) for t in tests], [set([fk3]), set([fk2])])
+
+            with self.assertNumQueries(3):
+                tests = list(qs.related_fallbacks().prefetch_related(
+                    'test_fks', 'test_fks__untrans'))
+            with self.assertNumQueries(0):
+                self.assertEqual([set(t.test_fks.all()) for t in tests],
+                                 [set([fk1, fk3]), set([fk2])])
+                self.assertEqual(set(fk.test for fk in tests[0].test_fks.all()), set([test1]))
+                self.assertEqual(set(fk.untrans for fk in tests[0].test_fks.all()),
+                                 set([test2, None]))
+            # Objects related through a fallback aren't altered
+            item = [fk for fk in tests[0].test_fks.all() if fk.pk == fk1.pk][0]
+            self.assertEqual((item.test_en_id, item.test_de_id), (None, test1.pk))
+            with override('de'):
+                tests = list(qs.related_fallbacks().prefetch_related('test_fks'))
+                self.assertEqual([set(t.test_fks.all()) for t in tests],
+                                 [set([fk1, fk2]), set()])
+
     def test_translation_fields_appending(self):
         from modeltranslation.manager import append_lookup_keys, append_lookup_key
         self.assertEqual(set(['untrans']), append_lookup_key(models.ForeignKeyModel, 'untrans'))
@@ -2930,6 +3713,30 @@ class TestManager(ModeltranslationTestBase):
         self.assertEqual(big_set.union(['title', 'title_en', 'title_de']),
                          append_lookup_keys(models.ForeignKeyModel, ['test__url', 'title']))
 
+    def test_rewrite_lookup_key_cache(self):
+        from modeltranslation.manager import _RLK_CACHE, rewrite_lookup_key
+        model = models.ForeignKeyModel
+        self.assertEqual('test_en__title_en__startswith',
+                         rewrite_lookup_key(model, 'test__title__startswith'))
+        self.assertIn((model, 'test__title__startswith', 'en'), _RLK_CACHE)
+        # Cached rewrites are language-aware
+        with override('de'):
+            self.assertEqual('test_de__title_de__startswith',
+                             rewrite_lookup_key(model, 'test__title__startswith'))
+        self.assertEqual('test_en__title_en__startswith',
+                         rewrite_lookup_key(model, 'test__title__startswith'))
+        # Registry changes flush the cache
+        registry = translator.translator._registry.copy()
+        try:
+            translator.translator.unregister(model)
+            self.assertNotIn((model, 'test__title__startswith', 'en'), _RLK_CACHE)
+            self.assertEqual('test__title_en__startswith',
+                             rewrite_lookup_key(model, 'test__title__startswith'))
+        finally:
+            translator.translator._registry = registry
+            from modeltranslation.manager import clear_rewrite_cache
+            clear_rewrite_cache()
+
     def test_constructor_inheritance(self):
         inst = models.AbstractModelB()
         # Check if fields assigned in constructor hasn't been ignored.
@@ -9,7 +9,7 @@ from modeltranslation.tests.models import (
     RichText, RichTextPage, MultitableModelA, MultitableModelB, MultitableModelC, ManagerTestModel,
     CustomManagerTestModel, CustomManager2TestModel, GroupFieldsetsModel, NameModel,
     ThirdPartyRegisteredModel, ProxyTestModel, UniqueNullableModel, OneToOneFieldModel,
-    RequiredModel, DecoratedModel)
+    RequiredModel, DecoratedModel, FilledModel, UntrackedModel)
 
 
 class TestTranslationOptions(TranslationOptions):
@@ -206,6 +206,22 @@ class DecoratedTranslationOptions(TranslationOptions):
     fields = ('title',)
 
 
+# ######### Filled languages testing
+
+@register(FilledModel)
+class FilledTranslationOptions(TranslationOptions):
+    fields = ('title', 'text', 'visits')
+    track_filled = True
+
+
+# ######### Coverage store testing
+
+@register(UntrackedModel)
+class UntrackedTranslationOptions(TranslationOptions):
+    fields = ('title',)
+    monitored_fields = ()
+
+
 # ######### 3-rd party with custom manager
 
 if VERSION >= (1, 8):
@@ -4,7 +4,7 @@ from django.utils.six import with_metaclass
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Manager, ForeignKey, OneToOneField
 from django.db.models.base import ModelBase
-from django.db.models.signals import post_init
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.db.models import DateTimeField
@@ -12,10 +12,15 @@ from django.db.models import DateTimeField
 from modeltranslation import settings as mt_settings
 from modeltranslation.fields import (NONE, create_translation_field, TranslationFieldDescriptor,
                                      TranslatedRelationIdDescriptor,
-                                     LanguageCacheSingleObjectDescriptor)
+                                     LanguageCacheSingleObjectDescriptor,
+                                     LanguageFallbackRelatedObjectsDescriptor, FilledLanguageField,
+                                     filled_field_name, remember_saved_values)
 from modeltranslation.manager import (MultilingualManager, MultilingualQuerysetManager,
-                                      rewrite_lookup_key)
-from modeltranslation.utils import build_localized_fieldname, parse_field
+                                      rewrite_lookup_key, clear_rewrite_cache)
+from modeltranslation.stats import (coverage_post_delete, coverage_post_save,
+                                    coverage_pre_delete, coverage_pre_save)
+from modeltranslation.utils import (build_localized_fieldname, cache_localized_fieldnames,
+                                    parse_field, resolution_order)
 
 
 NEW_RELATED_API = VERSION >= (1, 9)
@@ -67,6 +72,8 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
     ``related_fields`` contains names of reverse lookup fields.
     """
     required_languages = ()
+    # Maintain an indexed ``translations_filled_<lang>`` column per language
+    track_filled = False
 
     def __init__(self, model):
         """
@@ -78,6 +85,7 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
         self.local_fields = dict((f, set()) for f in self.fields)
         self.fields = dict((f, set()) for f in self.fields)
         self.related_fields = []
+        self.meta = None
 
     def validate(self):
         """
@@ -159,6 +167,100 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
         return '%s: %s + %s' % (self.__class__.__name__, local, inherited)
 
 
+class TranslationMeta(object):
+    """
+    Immutable, precompiled view of the translation options of a model.
+
+    It is built by ``Translator.register`` once all translation fields have been added to the
+    model, so that hot paths (queryset rewriting, population, descriptors) don't have to
+    rebuild names and field collections on every call:
+
+    ``fields``             -- tuple of translated field names (including inherited ones);
+    ``languages``          -- languages the translation fields were created for;
+    ``localized``          -- original name -> tuple of localized names (in ``languages`` order);
+    ``localized_by_lang``  -- (original name, language) -> localized name;
+    ``fk_attnames``        -- original name -> {language: attname} for translated ForeignKeys;
+    ``defaults``           -- original name -> field default (``NONE`` when it's callable);
+    ``empty_values``       -- localized name -> empty value marker of the translation field;
+    ``fallback_languages`` -- original name -> fallback languages override (or ``None``);
+    ``tracked``            -- localized names which have a ``_last_modified`` companion.
+
+    Languages to check for a given active language are available through ``fallback_names``.
+    """
+    __slots__ = ('model', 'fields', 'languages', 'localized', 'localized_by_lang', 'fk_attnames',
+                 'defaults', 'empty_values', 'fallback_languages', 'tracked', '_fallback_names')
+
+    def __init__(self, model, opts):
+        init = super(TranslationMeta, self).__setattr__
+        languages = tuple(mt_settings.AVAILABLE_LANGUAGES)
+        model_fallback_languages = getattr(opts, 'fallback_languages', None)
+        concrete_names = set(f.name for f in model._meta.fields)
+
+        localized = {}
+        localized_by_lang = {}
+        fk_attnames = {}
+        defaults = {}
+        empty_values = {}
+        fallback_languages = {}
+        for field_name, translation_fields in opts.fields.items():
+            by_lang = dict((f.language, f) for f in translation_fields)
+            names = []
+            for lang in languages:
+                name = build_localized_fieldname(field_name, lang)
+                names.append(name)
+                localized_by_lang[field_name, lang] = name
+                if lang in by_lang:
+                    empty_values[name] = by_lang[lang].empty_value
+            localized[field_name] = tuple(names)
+
+            field = model._meta.get_field(field_name)
+            if isinstance(field, ForeignKey):
+                fk_attnames[field_name] = dict(
+                    (lang, model._meta.get_field(name).get_attname())
+                    for lang, name in zip(languages, names))
+            if field.has_default() and callable(field.default):
+                defaults[field_name] = NONE
+            else:
+                defaults[field_name] = field.get_default()
+
+            if field_name in opts.local_fields:
+                fallback_languages[field_name] = model_fallback_languages
+            else:
+                # Inherited from a concrete parent - the parent's descriptor knows the override.
+                descriptor = getattr(model, field_name, None)
+                fallback_languages[field_name] = getattr(descriptor, 'fallback_languages', None)
+
+        init('model', model)
+        init('fields', tuple(opts.fields.keys()))
+        init('languages', languages)
+        init('localized', localized)
+        init('localized_by_lang', localized_by_lang)
+        init('fk_attnames', fk_attnames)
+        init('defaults', defaults)
+        init('empty_values', empty_values)
+        init('fallback_languages', fallback_languages)
+        init('tracked', tuple(
+            name for names in localized.values() for name in names
+            if '%s_last_modified' % name in concrete_names))
+        init('_fallback_names', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is immutable.' % self.__class__.__name__)
+
+    def fallback_names(self, field_name, lang):
+        """
+        Return localized names of ``field_name`` to check, in order, when ``lang`` is active.
+        """
+        langs = resolution_order(lang, self.fallback_languages[field_name])
+        try:
+            return self._fallback_names[field_name, langs]
+        except KeyError:
+            names = tuple(self.localized_by_lang.get((field_name, l)) or
+                          build_localized_fieldname(field_name, l) for l in langs)
+            self._fallback_names[field_name, langs] = names
+            return names
+
+
 def add_translation_fields(model, opts):
     """
     Monkey patches the original model class to provide additional fields for
@@ -172,6 +274,7 @@ def add_translation_fields(model, opts):
     monitored_fields = opts.monitored_fields
 
     model_empty_values = getattr(opts, 'empty_values', NONE)
+    cache_localized_fieldnames(opts.local_fields.keys())
     for field_name in opts.local_fields.keys():
         field_empty_value = parse_field(model_empty_values, field_name, NONE)
         for l in mt_settings.AVAILABLE_LANGUAGES:
@@ -196,6 +299,14 @@ def add_translation_fields(model, opts):
                 last_modified_field = DateTimeField(default=timezone.now, editable=False)
                 modified_localized_name = '{0}_last_modified'.format(localized_field_name)
                 model.add_to_class(modified_localized_name, last_modified_field)
+                translation_field.last_modified_name = modified_localized_name
+
+    # Languages in which all translation fields of the model's table are filled
+    if opts.track_filled and opts.local_fields:
+        for l in mt_settings.AVAILABLE_LANGUAGES:
+            model.add_to_class(filled_field_name(l),
+                               FilledLanguageField(tuple(opts.local_fields.keys()), l))
+        patch_save_filled(model)
 
     # Rebuild information about parents fields. If there are opts.local_fields, field cache would be
     # invalidated (by model._meta.add_field() function). Otherwise, we need to do it manually.
@@ -220,6 +331,41 @@ def has_custom_queryset(manager):
         model._meta._fill_fields_cache()
 
 
+# Custom manager class -> its subclass merged with MultilingualManager (see
+# ``multilingual_manager_class``). Manager classes are defined once, so entries live for the
+# whole process.
+_MANAGER_CLASSES = {}
+
+
+def multilingual_manager_class(manager):
+    """
+    Returns the class of ``manager`` merged with MultilingualManager. It is created once per
+    manager class, so managers of the same class share it.
+    """
+    manager_class = manager.__class__
+    try:
+        return _MANAGER_CLASSES[manager_class]
+    except KeyError:
+        pass
+
+    class NewMultilingualManager(MultilingualManager, manager_class, MultilingualQuerysetManager):
+        use_for_related_fields = getattr(
+            manager_class, "use_for_related_fields", not has_custom_queryset(manager))
+        _old_module = manager.__module__
+        _old_class = manager_class.__name__
+
+        def deconstruct(self):
+            return (
+                False,  # as_manager
+                '%s.%s' % (self._old_module, self._old_class),  # manager_class
+                None,  # qs_class
+                self._constructor_args[0],  # args
+                self._constructor_args[1],  # kwargs
+            )
+
+    return _MANAGER_CLASSES.setdefault(manager_class, NewMultilingualManager)
+
+
 def add_manager(model):
     """
     Monkey patches the original model to use MultilingualManager instead of
@@ -236,23 +382,7 @@ def add_manager(model):
         if manager.__class__ is Manager:
             manager.__class__ = MultilingualManager
         else:
-            class NewMultilingualManager(MultilingualManager, manager.__class__,
-                                         MultilingualQuerysetManager):
-                use_for_related_fields = getattr(
-                    manager.__class__, "use_for_related_fields", not has_custom_queryset(manager))
-                _old_module = manager.__module__
-                _old_class = manager.__class__.__name__
-
-                def deconstruct(self):
-                    return (
-                        False,  # as_manager
-                        '%s.%s' % (self._old_module, self._old_class),  # manager_class
-                        None,  # qs_class
-                        self._constructor_args[0],  # args
-                        self._constructor_args[1],  # kwargs
-                    )
-
-            manager.__class__ = NewMultilingualManager
+            manager.__class__ = multilingual_manager_class(manager)
 
     for _, attname, cls in model._meta.concrete_managers + model._meta.abstract_managers:
         current_manager = getattr(model, attname)
@@ -291,6 +421,32 @@ def delete_mt_init(sender, instance, **kwargs):
         del instance._mt_init
 
 
+def patch_save_filled(model):
+    """
+    Patches ``save`` to also write the ``track_filled`` columns of languages whose translation
+    fields are listed in ``update_fields``.
+    """
+    # Translation field name or attname -> names of filled columns depending on it
+    dependents = {}
+    for f in model._meta.concrete_fields:
+        if isinstance(f, FilledLanguageField):
+            for field_name in f.translated_fields:
+                field = model._meta.get_field(build_localized_fieldname(field_name, f.language))
+                dependents.setdefault(field.name, set()).add(f.name)
+                dependents.setdefault(field.attname, set()).add(f.name)
+    old_save = model.save
+
+    # Same arguments as Model.save, update_fields may be passed by position
+    def new_save(self, force_insert=False, force_update=False, using=None, update_fields=None,
+                 **kwargs):
+        if update_fields:
+            update_fields = set(update_fields)
+            for name in list(update_fields):
+                update_fields.update(dependents.get(name, ()))
+        old_save(self, force_insert, force_update, using, update_fields, **kwargs)
+    model.save = new_save
+
+
 def patch_clean_fields(model):
     """
     Patch clean_fields method to handle different form types submission.
@@ -330,6 +486,52 @@ def patch_get_deferred_fields(model):
     model.get_deferred_fields = new_get_deferred_fields
 
 
+def patch_from_db(model, meta):
+    """
+    Django >= 1.8: patch creating instances from database rows to remember loaded values of
+    monitored translation fields and their ``_last_modified`` fields, so saving doesn't have to
+    query them for changes (nor for the coverage store). Values reloaded with
+    ``refresh_from_db`` are remembered as well.
+    """
+    if not meta.tracked or not hasattr(model, 'from_db'):
+        return
+    old_from_db = model.from_db.__func__
+    attnames = tuple(model._meta.get_field(name).attname for name in meta.tracked) + tuple(
+        '{0}_last_modified'.format(name) for name in meta.tracked)
+
+    def new_from_db(cls, db, field_names, values):
+        instance = old_from_db(cls, db, field_names, values)
+        loaded = instance.__dict__
+        instance._mt_snapshot = dict(
+            (attname, loaded[attname]) for attname in attnames if attname in loaded)
+        return instance
+    model.from_db = classmethod(new_from_db)
+
+    if not hasattr(model, 'refresh_from_db'):
+        return
+    old_refresh_from_db = model.refresh_from_db
+
+    def new_refresh_from_db(self, using=None, fields=None, **kwargs):
+        old_refresh_from_db(self, using=using, fields=fields, **kwargs)
+        if fields is None:
+            refreshed = attnames
+        else:
+            refreshed = [self._meta.get_field(name).attname for name in fields]
+        # Lean querysets don't reload other languages, those values are forgotten
+        lean_deferred = getattr(self.__class__._default_manager.all(), '_lean_deferred', set)()
+        skipped = set(self._meta.get_field(name).attname for name in lean_deferred)
+        loaded = self.__dict__
+        snapshot = loaded.setdefault('_mt_snapshot', {})
+        for attname in refreshed:
+            if attname not in attnames:
+                continue
+            if attname in loaded and attname not in skipped:
+                snapshot[attname] = loaded[attname]
+            else:
+                snapshot.pop(attname, None)
+    model.refresh_from_db = new_refresh_from_db
+
+
 def patch_metaclass(model):
     """
     Monkey patches original model metaclass to exclude translated fields on deferred subclasses.
@@ -347,9 +549,9 @@ def patch_metaclass(model):
         """
         def __new__(cls, name, bases, attrs):
             if attrs.get('_deferred', False):
-                opts = translator.get_options_for_model(model)
+                meta = translator.get_options_for_model(model).meta
                 were_deferred = set()
-                for field_name in opts.fields.keys():
+                for field_name in meta.fields:
                     if attrs.pop(field_name, None):
                         # Field was deferred. Store this for future reference.
                         were_deferred.add(field_name)
@@ -407,13 +609,13 @@ def populate_translation_fields(sender, kwargs):
         # What was meant by ``True`` is now called ``all``.
         populate = 'all'
 
-    opts = translator.get_options_for_model(sender)
+    localized = translator.get_options_for_model(sender).meta.localized
     for key, val in list(kwargs.items()):
-        if key in opts.fields:
+        if key in localized:
             if populate == 'all':
                 # Set the value for every language.
-                for translation_field in opts.fields[key]:
-                    kwargs.setdefault(translation_field.name, val)
+                for name in localized[key]:
+                    kwargs.setdefault(name, val)
             elif populate == 'default':
                 default = build_localized_fieldname(key, mt_settings.DEFAULT_LANGUAGE)
                 kwargs.setdefault(default, val)
@@ -436,6 +638,22 @@ def patch_related_object_descriptor_caching(ro_descriptor):
     ro_descriptor.__class__ = NewSingleObjectDescriptor
 
 
+def patch_related_manager_prefetching(ro_descriptor):
+    """
+    Patch ForeignRelatedObjectsDescriptor (ReverseManyToOneDescriptor) so that its related managers
+    can prefetch objects related through fallback languages.
+    """
+    if isinstance(ro_descriptor, LanguageFallbackRelatedObjectsDescriptor):
+        return
+
+    class NewRelatedObjectsDescriptor(LanguageFallbackRelatedObjectsDescriptor,
+                                      ro_descriptor.__class__):
+        pass
+    # The manager class may have been built already.
+    ro_descriptor.__dict__.pop('related_manager_cls', None)
+    ro_descriptor.__class__ = NewRelatedObjectsDescriptor
+
+
 class Translator(object):
     """
     A Translator object encapsulates an instance of a translator. Models are
@@ -487,6 +705,10 @@ class Translator(object):
             # Add translation fields to the model.
             if model._meta.proxy:
                 delete_cache_fields(model)
+                # Proxies share the ``_last_modified`` fields of their concrete model
+                opts.monitored_fields = getattr(
+                    self._get_options_for_model(model._meta.concrete_model), 'monitored_fields',
+                    [])
             else:
                 add_translation_fields(model, opts)
 
@@ -505,6 +727,10 @@ class Translator(object):
 
             # Connect signal for model
             post_init.connect(delete_mt_init, sender=model)
+            pre_save.connect(coverage_pre_save, sender=model)
+            post_save.connect(coverage_post_save, sender=model)
+            pre_delete.connect(coverage_pre_delete, sender=model)
+            post_delete.connect(coverage_post_delete, sender=model)
 
             # Patch clean_fields to verify form field clearing
             patch_clean_fields(model)
@@ -513,6 +739,12 @@ class Translator(object):
             patch_metaclass(model)
             patch_get_deferred_fields(model)
 
+            # Precompile translation metadata used by managers and descriptors
+            opts.meta = meta = TranslationMeta(model, opts)
+            patch_from_db(model, meta)
+            if meta.tracked:
+                post_save.connect(remember_saved_values, sender=model)
+
             # Substitute original field with descriptor
             model_fallback_languages = getattr(opts, 'fallback_languages', None)
             model_fallback_values = getattr(opts, 'fallback_values', NONE)
@@ -525,13 +757,15 @@ class Translator(object):
                     field,
                     fallback_languages=model_fallback_languages,
                     fallback_value=field_fallback_value,
-                    fallback_undefined=field_fallback_undefined)
+                    fallback_undefined=field_fallback_undefined,
+                    meta=meta)
                 setattr(model, field_name, descriptor)
                 if isinstance(field, ForeignKey):
                     # We need to use a special descriptor so that
                     # _id fields on translated ForeignKeys work
                     # as expected.
-                    desc = TranslatedRelationIdDescriptor(field_name, model_fallback_languages)
+                    desc = TranslatedRelationIdDescriptor(field_name, model_fallback_languages,
+                                                          meta=meta)
                     setattr(model, field.get_attname(), desc)
 
                     # Set related field names on other model
@@ -539,13 +773,25 @@ class Translator(object):
                         other_opts = self._get_options_for_model(field.remote_field.to)
                         other_opts.related = True
                         other_opts.related_fields.append(field.related_query_name())
+                        if other_opts.meta is None:
+                            other_opts.meta = TranslationMeta(field.remote_field.to, other_opts)
                         # Add manager in case of non-registered model
                         add_manager(field.remote_field.to)
+                        if not isinstance(field, OneToOneField):
+                            # Let prefetch_related follow fallback languages
+                            patch_related_manager_prefetching(getattr(
+                                field.remote_field.to, field.remote_field.get_accessor_name()))
                     elif not NEW_RELATED_API and not field.rel.is_hidden():
                         other_opts = self._get_options_for_model(field.rel.to)
                         other_opts.related = True
                         other_opts.related_fields.append(field.related_query_name())
+                        if other_opts.meta is None:
+                            other_opts.meta = TranslationMeta(field.rel.to, other_opts)
                         add_manager(field.rel.to)  # Add manager in case of non-registered model
+                        if not isinstance(field, OneToOneField):
+                            # Let prefetch_related follow fallback languages
+                            patch_related_manager_prefetching(
+                                getattr(field.rel.to, field.related.get_accessor_name()))
 
                 if isinstance(field, OneToOneField):
                     # Fix translated_field caching for SingleRelatedObjectDescriptor
@@ -555,6 +801,9 @@ class Translator(object):
                         else getattr(field.rel.to, field.related.get_accessor_name()))
                     patch_related_object_descriptor_caching(sro_descriptor)
 
+        # Lookups rewritten so far may no longer be valid.
+        clear_rewrite_cache()
+
     def unregister(self, model_or_iterable):
         """
         Unregisters the given model(s).
@@ -581,6 +830,7 @@ class Translator(object):
                         ' unregistering its base "%s"' %
                         (desc.__name__, model.__name__))
                 del self._registry[desc]
+        clear_rewrite_cache()
 
     def get_registered_models(self, abstract=True):
         """
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+from collections import namedtuple
 from contextlib import contextmanager
 
 from django.utils import six
+from django.utils.six.moves import intern
 from django.utils.encoding import force_text
 from django.utils.translation import get_language as _get_language
 from django.utils.translation import get_language_info
@@ -10,17 +12,41 @@ from django.utils.functional import lazy
 from modeltranslation import settings
 
 
+# Raw Django language code -> normalized modeltranslation language. Filled lazily and reset
+# whenever settings get reloaded (AVAILABLE_LANGUAGES is then a new object).
+_LANGUAGE_CACHE = {}
+_LANGUAGE_CACHE_SIZE = 256
+# [AVAILABLE_LANGUAGES the cache was filled for, the same as a frozenset]
+_LANGUAGE_CACHE_FOR = [None, frozenset()]
+
+
 def get_language():
     """
     Return an active language code that is guaranteed to be in
     settings.LANGUAGES (Django does not seem to guarantee this for us).
     """
     lang = _get_language()
+    if _LANGUAGE_CACHE_FOR[0] is settings.AVAILABLE_LANGUAGES:
+        try:
+            return _LANGUAGE_CACHE[lang]
+        except KeyError:
+            pass
+    else:
+        _LANGUAGE_CACHE.clear()
+        _LANGUAGE_CACHE_FOR[:] = [settings.AVAILABLE_LANGUAGES,
+                                  frozenset(settings.AVAILABLE_LANGUAGES)]
+    if len(_LANGUAGE_CACHE) >= _LANGUAGE_CACHE_SIZE:
+        _LANGUAGE_CACHE.clear()
+    _LANGUAGE_CACHE[lang] = normalized = _normalize_language(lang, _LANGUAGE_CACHE_FOR[1])
+    return normalized
+
+
+def _normalize_language(lang, available):
     if lang is None:  # Django >= 1.8
         return settings.DEFAULT_LANGUAGE
-    if lang not in settings.AVAILABLE_LANGUAGES and '-' in lang:
+    if lang not in available and '-' in lang:
         lang = lang.split('-')[0]
-    if lang in settings.AVAILABLE_LANGUAGES:
+    if lang in available:
         return lang
     return settings.DEFAULT_LANGUAGE
 
@@ -40,7 +66,19 @@ def get_translation_fields(field):
     return [build_localized_fieldname(field, l) for l in settings.AVAILABLE_LANGUAGES]
 
 
+# (field name, lang) -> interned localized field name, filled for registered fields by
+# ``cache_localized_fieldnames``.
+_LOCALIZED_FIELDNAMES = {}
+
+
 def build_localized_fieldname(field_name, lang):
+    try:
+        return _LOCALIZED_FIELDNAMES[field_name, lang]
+    except KeyError:
+        return _build_localized_fieldname(field_name, lang)
+
+
+def _build_localized_fieldname(field_name, lang):
     if lang == 'id':
         # The 2-letter Indonesian language code is problematic with the
         # current naming scheme as Django foreign keys also add "id" suffix.
@@ -48,6 +86,21 @@ def build_localized_fieldname(field_name, lang):
     return str('%s_%s' % (field_name, lang.replace('-', '_')))
 
 
+def cache_localized_fieldnames(field_names, languages=None):
+    """
+    Precompute localized names of ``field_names`` for ``languages`` (all available languages
+    by default), so that ``build_localized_fieldname`` returns them without formatting.
+
+    Names are interned, making attribute lookups with them take the string identity fast path.
+    """
+    if languages is None:
+        languages = settings.AVAILABLE_LANGUAGES
+    for field_name in field_names:
+        for lang in languages:
+            _LOCALIZED_FIELDNAMES[field_name, lang] = intern(
+                _build_localized_fieldname(field_name, lang))
+
+
 def _build_localized_verbose_name(verbose_name, lang):
     if lang == 'id':
         lang = 'ind'
@@ -102,14 +155,52 @@ def unique(seq):
     return (x for x in seq if x not in seen and not seen.add(x))
 
 
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+# Memoized resolution orders, keyed by (lang, id(override)). Every entry holds a reference to its
+# override, so an id can't be reused while it's cached; overrides (``fallback_languages``
+# translation option) are expected not to be mutated after registration.
+# There's one entry per language and override at most, so instead of tracking recency, the cache
+# is just emptied when it gets full.
+_RESOLUTION_CACHE = {}
+_RESOLUTION_CACHE_SIZE = 256
+_RESOLUTION_CACHE_STATS = {'hits': 0, 'misses': 0}
+# FALLBACK_LANGUAGES setting the cache was filled for (changes when settings get reloaded).
+_RESOLUTION_CACHE_FOR = [None]
+
+
 def resolution_order(lang, override=None):
     """
     Return order of languages which should be checked for parameter language.
     First is always the parameter language, later are fallback languages.
     Override parameter has priority over FALLBACK_LANGUAGES.
+
+    Results are memoized; ``resolution_order.cache_info()`` reports hits and misses.
     """
     if not settings.ENABLE_FALLBACKS:
+        # Trivial - bypasses the cache (e.g. inside ``fallbacks(False)``).
         return (lang,)
+    if _RESOLUTION_CACHE_FOR[0] is not settings.FALLBACK_LANGUAGES:
+        _RESOLUTION_CACHE.clear()
+        _RESOLUTION_CACHE_FOR[0] = settings.FALLBACK_LANGUAGES
+    key = (lang, id(override))
+    try:
+        entry = _RESOLUTION_CACHE[key]
+    except KeyError:
+        pass
+    else:
+        if entry[0] is override:
+            _RESOLUTION_CACHE_STATS['hits'] += 1
+            return entry[1]
+    _RESOLUTION_CACHE_STATS['misses'] += 1
+    order = _resolution_order(lang, override)
+    if len(_RESOLUTION_CACHE) >= _RESOLUTION_CACHE_SIZE:
+        _RESOLUTION_CACHE.clear()
+    _RESOLUTION_CACHE[key] = (override, order)
+    return order
+
+
+def _resolution_order(lang, override):
     if override is None:
         override = {}
     fallback_for_lang = override.get(lang, settings.FALLBACK_LANGUAGES.get(lang, ()))
@@ -118,6 +209,26 @@ def resolution_order(lang, override=None):
     return tuple(unique(order))
 
 
+def _resolution_order_cache_info():
+    """
+    Report ``resolution_order`` cache statistics (same fields as ``functools.lru_cache``).
+    """
+    return CacheInfo(_RESOLUTION_CACHE_STATS['hits'], _RESOLUTION_CACHE_STATS['misses'],
+                     _RESOLUTION_CACHE_SIZE, len(_RESOLUTION_CACHE))
+
+
+def _resolution_order_cache_clear():
+    """
+    Empty ``resolution_order`` cache and reset its statistics.
+    """
+    _RESOLUTION_CACHE.clear()
+    _RESOLUTION_CACHE_STATS.update(hits=0, misses=0)
+
+
+resolution_order.cache_info = _resolution_order_cache_info
+resolution_order.cache_clear = _resolution_order_cache_clear
+
+
 @contextmanager
 def auto_populate(mode='all'):
     """
@@ -21,7 +21,8 @@ setup(
     maintainer='Dirk Eschler',
     maintainer_email='eschler@gmail.com',
     url='https://github.com/deschler/django-modeltranslation',
-    packages=['modeltranslation', 'modeltranslation.management',
+    packages=['modeltranslation', 'modeltranslation.coverage',
+              'modeltranslation.coverage.migrations', 'modeltranslation.management',
               'modeltranslation.management.commands'],
     package_data={'modeltranslation': ['static/modeltranslation/css/*.css',
                                        'static/modeltranslation/js/*.js']},